@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
 from ai_reasoning_algorithms import (
     ActorCriticAlgorithm,
@@ -13,20 +13,24 @@ class BaseAgent:
         self.name = name
         self.mental_models: List[MentalModel] = []
         self.ai_algorithms: List[AIReasoningAlgorithm] = []
+        # (name, bound method) pairs resolved once at registration; mental
+        # models always run before AI algorithms
+        self._model_dispatch: List[Tuple[str, Callable[[Dict[str, Any]], str]]] = []
+        self._algo_dispatch: List[Tuple[str, Callable[[Dict[str, Any]], str]]] = []
+        self._dispatch: List[Tuple[str, Callable[[Dict[str, Any]], str]]] = []
 
     def add_mental_model(self, model: MentalModel):
         self.mental_models.append(model)
+        self._model_dispatch.append((model.name, model.apply))
+        self._dispatch = self._model_dispatch + self._algo_dispatch
 
     def add_ai_algorithm(self, algo: AIReasoningAlgorithm):
         self.ai_algorithms.append(algo)
+        self._algo_dispatch.append((algo.name, algo.reason))
+        self._dispatch = self._model_dispatch + self._algo_dispatch
 
     def process_request(self, request: Dict[str, Any]) -> Dict[str, str]:
-        results = {}
-        for model in self.mental_models:
-            results[model.name] = model.apply(request)
-        for algo in self.ai_algorithms:
-            results[algo.name] = algo.reason(request)
-        return results
+        return {name: fn(request) for name, fn in self._dispatch}
 
 
 class ActorCriticAgent(BaseAgent):
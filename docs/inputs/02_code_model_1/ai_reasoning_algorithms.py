@@ -1,6 +1,27 @@
-import random
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the interpreted kernel
+    njit = None
+
+
+def _eps_greedy_select(
+    rewards: np.ndarray, epsilon: float, u: float, k_rand: int
+) -> int:
+    """
+    Epsilon-greedy arm selection over a reward array.
+    """
+    if u < epsilon:
+        return k_rand
+    return int(np.argmax(rewards))
+
+
+if njit is not None:
+    _eps_greedy_select = njit(cache=True, fastmath=True)(_eps_greedy_select)
 
 
 class AIReasoningAlgorithm(ABC):
@@ -28,10 +49,10 @@ class ReActAlgorithm(AIReasoningAlgorithm):
             description="Combines reasoning traces with actions in external tools/env.",
             typical_applications="Interactive decision-making, complex task solving.",
         )
+        self._template = f"[{self.name}] Reasoned about '%s' and performed actions."
 
     def reason(self, context: Dict[str, Any]) -> str:
-        decision_point = context.get("decision_point", "N/A")
-        return f"[{self.name}] Reasoned about '{decision_point}' and performed actions."
+        return self._template % (context.get("decision_point", "N/A"),)
 
 
 class ChainOfThoughtAlgorithm(AIReasoningAlgorithm):
@@ -41,15 +62,17 @@ class ChainOfThoughtAlgorithm(AIReasoningAlgorithm):
             description="Step-by-step reasoning before final answer.",
             typical_applications="Complex problem-solving, mathematical reasoning.",
         )
+        steps = ", ".join(
+            [
+                "Step 1: Analyze problem.",
+                "Step 2: Identify constraints.",
+                "Step 3: Solve.",
+            ]
+        )
+        self._template = f"[{self.name}] Generated reasoning chain for '%s': {steps}."
 
     def reason(self, context: Dict[str, Any]) -> str:
-        problem_statement = context.get("problem_statement", "N/A")
-        steps = [
-            "Step 1: Analyze problem.",
-            "Step 2: Identify constraints.",
-            "Step 3: Solve.",
-        ]
-        return f"[{self.name}] Generated reasoning chain for '{problem_statement}': {', '.join(steps)}."
+        return self._template % (context.get("problem_statement", "N/A"),)
 
 
 class ActorCriticAlgorithm(AIReasoningAlgorithm):
@@ -61,11 +84,13 @@ class ActorCriticAlgorithm(AIReasoningAlgorithm):
         )
         self.actor_policy = {}
         self.critic_values = {}
+        self.actions = ("ActionA", "ActionB", "ActionC")
+        self._rng = np.random.default_rng()
 
     def reason(self, context: Dict[str, Any]) -> str:
         state = context.get("environment_state", "No state provided")
-        action = random.choice(["ActionA", "ActionB", "ActionC"])
-        reward = random.uniform(0, 1)  ## Simulated reward
+        action = self.actions[self._rng.integers(len(self.actions))]
+        reward = self._rng.random()  ## Simulated reward
         self.critic_values[state] = reward
         return f"[{self.name}] Chose action '{action}' in state '{state}' with reward {reward:.2f}."
 
@@ -79,21 +104,68 @@ class MultiArmedBanditAlgorithm(AIReasoningAlgorithm):
         )
         self.method = method
         self.epsilon = epsilon
-        self.arm_rewards = {}
+        # Structure-of-arrays bookkeeping: arm name -> slot in the reward arrays
+        self._arm_index: Dict[str, int] = {}
+        self._arm_names: List[str] = []
+        self._rewards = np.zeros(0, dtype=np.float64)
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._rng = np.random.default_rng()
+
+    @property
+    def arm_rewards(self) -> Dict[str, float]:
+        """Cumulative reward per arm that has been pulled at least once."""
+        return {
+            name: float(self._rewards[idx])
+            for name, idx in self._arm_index.items()
+            if self._counts[idx]
+        }
+
+    def _register_arms(self, arms: List[str]) -> None:
+        """Assign array slots to arms that have not been seen before."""
+        new_arms = [arm for arm in arms if arm not in self._arm_index]
+        if not new_arms:
+            return
+        for arm in new_arms:
+            self._arm_index[arm] = len(self._arm_names)
+            self._arm_names.append(arm)
+        size = len(self._arm_names)
+        old_size = len(self._rewards)
+        self._rewards = np.resize(self._rewards, size)
+        self._counts = np.resize(self._counts, size)
+        self._rewards[old_size:] = 0.0
+        self._counts[old_size:] = 0
 
     def reason(self, context: Dict[str, Any]) -> str:
+        u_explore, u_arm, reward = self._rng.random(3)
+        return self._step(context, u_explore, u_arm, reward)
+
+    def reason_many(self, contexts: List[Dict[str, Any]]) -> List[str]:
+        """
+        Reason over a batch of contexts, drawing all random numbers up front.
+        """
+        draws = self._rng.random((len(contexts), 3))
+        return [
+            self._step(context, u_explore, u_arm, reward)
+            for context, (u_explore, u_arm, reward) in zip(contexts, draws)
+        ]
+
+    def _step(
+        self, context: Dict[str, Any], u_explore: float, u_arm: float, reward: float
+    ) -> str:
+        """
+        Select an arm and record its simulated reward, using pre-drawn
+        uniforms in [0, 1).
+        """
         arms = context.get("bandit_arms", [])
-        if self.method == "epsilon-greedy":
-            if random.random() < self.epsilon:
-                chosen_arm = random.choice(arms)
-            else:
-                chosen_arm = max(
-                    self.arm_rewards,
-                    key=self.arm_rewards.get,
-                    default=random.choice(arms),
-                )
+        self._register_arms(arms)
+        k_rand = self._arm_index[arms[int(u_arm * len(arms))]]
+        if self.method == "epsilon-greedy" and self._counts.any():
+            idx = _eps_greedy_select(self._rewards, self.epsilon, u_explore, k_rand)
         else:
-            chosen_arm = random.choice(arms)
-        reward = random.uniform(0, 1)  ## Simulated reward
-        self.arm_rewards[chosen_arm] = self.arm_rewards.get(chosen_arm, 0) + reward
-        return f"[{self.name}] Selected arm '{chosen_arm}' with reward {reward:.2f}."
+            idx = k_rand
+        self._rewards[idx] += reward
+        self._counts[idx] += 1
+        return (
+            f"[{self.name}] Selected arm '{self._arm_names[idx]}' "
+            f"with reward {reward:.2f}."
+        )
@@ -38,11 +38,15 @@ class EisenhowerMatrix(MentalModel):
 
     def apply(self, context: Dict[str, Any]) -> str:
         tasks = context.get("tasks", [])
-        urgent_tasks = [task for task in tasks if "urgent" in task]
-        important_tasks = [task for task in tasks if "important" in task]
+        urgent = important = 0
+        for task in tasks:
+            if "urgent" in task:
+                urgent += 1
+            if "important" in task:
+                important += 1
         return (
-            f"[{self.name}] Prioritized tasks: {len(urgent_tasks)} urgent, "
-            f"{len(important_tasks)} important."
+            f"[{self.name}] Prioritized tasks: {urgent} urgent, "
+            f"{important} important."
         )
 
 
@@ -54,7 +58,7 @@ class SecondOrderThinking(MentalModel):
             description="Considers long-term consequences of decisions.",
             typical_applications="Strategic planning, risk assessment.",
         )
+        self._template = f"[{self.name}] Analyzed long-term consequences for '%s'."
 
     def apply(self, context: Dict[str, Any]) -> str:
-        decision = context.get("decision", "No decision")
-        return f"[{self.name}] Analyzed long-term consequences for '{decision}'."
+        return self._template % (context.get("decision", "No decision"),)
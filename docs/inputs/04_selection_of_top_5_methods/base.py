@@ -3,22 +3,40 @@ Base classes and interfaces for the agent implementation.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
-@dataclass
 class AgentContext:
-    """Context object that holds the current state and environment information."""
+    """Context object that holds the current state and environment information.
 
-    state: Dict[str, Any]
-    memory: Dict[str, Any]
-    tools: Dict[str, Any]
+    The backing dicts are only allocated on first access, since many agents
+    (e.g. Society of Mind sub-agents) never touch their context.
+    """
+
+    __slots__ = ("_state", "_memory", "_tools")
 
     def __init__(self):
-        self.state = {}
-        self.memory = {}
-        self.tools = {}
+        self._state: Optional[Dict[str, Any]] = None
+        self._memory: Optional[Dict[str, Any]] = None
+        self._tools: Optional[Dict[str, Any]] = None
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        if self._state is None:
+            self._state = {}
+        return self._state
+
+    @property
+    def memory(self) -> Dict[str, Any]:
+        if self._memory is None:
+            self._memory = {}
+        return self._memory
+
+    @property
+    def tools(self) -> Dict[str, Any]:
+        if self._tools is None:
+            self._tools = {}
+        return self._tools
 
 
 class BaseAgent(ABC):
@@ -44,6 +62,10 @@ class BaseAgent(ABC):
         return self.act(thoughts)
 
 
+class ToolError(Exception):
+    """Raised by a tool when an execution attempt fails and may be retried."""
+
+
 class Tool:
     """Base class for tools that agents can use."""
 
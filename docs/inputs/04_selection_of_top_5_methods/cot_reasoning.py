@@ -2,10 +2,31 @@
 Chain-of-Thought (CoT) Reasoning implementation.
 """
 
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 from .base import BaseAgent
 
+# Confidence is 0.5 plus 0.1 per thought, saturating at 1.0 from five thoughts
+_FULL_CONFIDENCE_AT = 5
+_CONFIDENCE_BY_COUNT = tuple(
+    min(0.5 + min(0.1 * count, 0.5), 1.0) for count in range(_FULL_CONFIDENCE_AT)
+)
+
+
+@lru_cache(maxsize=4096)
+def _break_down(problem: str) -> Tuple[str, ...]:
+    """Split a problem into sub-problems, memoized per problem text."""
+    # This is a simple implementation - in practice, you might use
+    # more sophisticated NLP techniques or LLM calls
+    words = problem.split()
+    if len(words) <= 3:
+        return (problem,)
+
+    # Simple strategy: break into chunks of 3 words; split() never yields
+    # empty words, so every chunk is non-empty
+    return tuple([" ".join(words[i : i + 3]) for i in range(0, len(words), 3)])
+
 
 class ChainOfThoughtAgent(BaseAgent):
     """
@@ -42,39 +63,31 @@ class ChainOfThoughtAgent(BaseAgent):
             solution = self._solve_sub_problem(sub_problem)
             thoughts.append(f"Solving {sub_problem}: {solution}")
 
-        # Step 4: Synthesize
-        thoughts.append(self._synthesize_thoughts(thoughts))
-
+        # Step 4 (synthesis) is deferred to act(), which is its only consumer
         return thoughts
 
     def act(self, thoughts: List[str]) -> Dict[str, Any]:
         """
         Take action based on the chain of thoughts.
         """
-        # Extract the final conclusion/solution from thoughts
-        final_thought = thoughts[-1] if thoughts else "No solution found"
+        # Synthesize the final conclusion/solution from the chain
+        if thoughts:
+            final_thought = self._synthesize_thoughts(thoughts)
+            # The synthesis still counts as a reasoning step
+            confidence = self._calculate_confidence([*thoughts, final_thought])
+        else:
+            final_thought = "No solution found"
+            confidence = self._calculate_confidence(thoughts)
 
         return {
             "solution": final_thought,
             "reasoning_chain": thoughts,
-            "confidence": self._calculate_confidence(thoughts),
+            "confidence": confidence,
         }
 
     def _break_down_problem(self, problem: str) -> List[str]:
         """Break down a problem into sub-problems."""
-        # This is a simple implementation - in practice, you might use
-        # more sophisticated NLP techniques or LLM calls
-        words = problem.split()
-        if len(words) <= 3:
-            return [problem]
-
-        # Simple strategy: break into chunks of 3 words
-        sub_problems = []
-        for i in range(0, len(words), 3):
-            chunk = " ".join(words[i : i + 3])
-            if chunk:
-                sub_problems.append(chunk)
-        return sub_problems
+        return list(_break_down(problem))
 
     def _solve_sub_problem(self, sub_problem: str) -> str:
         """Solve an individual sub-problem."""
@@ -89,6 +102,5 @@ class ChainOfThoughtAgent(BaseAgent):
     def _calculate_confidence(self, thoughts: List[str]) -> float:
         """Calculate confidence in the solution based on the thought process."""
         # Simple heuristic: confidence based on number of thoughts
-        base_confidence = 0.5
-        thought_bonus = min(0.1 * len(thoughts), 0.5)
-        return min(base_confidence + thought_bonus, 1.0)
+        count = len(thoughts)
+        return _CONFIDENCE_BY_COUNT[count] if count < _FULL_CONFIDENCE_AT else 1.0
@@ -2,7 +2,7 @@
 ReAct (Reasoning + Acting) implementation.
 """
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base import BaseAgent, Tool
 
@@ -17,10 +17,15 @@ class ReActAgent(BaseAgent):
         super().__init__(name)
         self.max_steps = 10  # Maximum number of think-act cycles
         self.available_tools: Dict[str, Tool] = {}
+        # Derived from available_tools; refreshed whenever a tool is added
+        self._first_tool_name: Optional[str] = None
+        self._tool_thoughts_cache: Optional[List[str]] = None
 
     def add_tool(self, tool: Tool):
         """Add a tool that the agent can use."""
         self.available_tools[tool.name] = tool
+        self._first_tool_name = next(iter(self.available_tools))
+        self._tool_thoughts_cache = None
 
     def think(self, input_data: Dict[str, Any]) -> List[str]:
         """
@@ -75,6 +80,9 @@ class ReActAgent(BaseAgent):
 
     def _think_about_tools(self) -> List[str]:
         """Generate thoughts about available tools and their applicability."""
+        if self._tool_thoughts_cache is not None:
+            return self._tool_thoughts_cache
+
         thoughts = []
         if not self.available_tools:
             thoughts.append("No tools available")
@@ -84,29 +92,35 @@ class ReActAgent(BaseAgent):
         for name, tool in self.available_tools.items():
             thoughts.append(f"- {name}: {tool.description}")
 
+        self._tool_thoughts_cache = thoughts
         return thoughts
 
     def _plan_next_action(self, state: Dict[str, Any], goal: str) -> str:
         """Plan the next action based on current state and goal."""
         # In practice, this would involve more sophisticated planning,
         # possibly using LLMs or other planning algorithms
-        if not self.available_tools:
+        if self._first_tool_name is None:
             return "No actions available"
 
         # Simple planning: pick the first available tool
-        tool_name = next(iter(self.available_tools))
-        return f"Use {tool_name} to progress toward goal: {goal}"
+        return f"Use {self._first_tool_name} to progress toward goal: {goal}"
 
     def _parse_action(self, action_thought: str) -> Tuple[str, Dict[str, Any]]:
         """Parse an action thought into tool name and parameters."""
-        # Simple parsing - in practice, this would be more sophisticated
-        parts = action_thought.split()
-        if len(parts) < 2 or parts[0] != "Use":
+        # Simple parsing of the "Use {tool} to progress toward goal: {goal}"
+        # template from _plan_next_action - in practice, this would be more
+        # sophisticated
+        action = action_thought.removeprefix("Planned action: ")
+        if not action.startswith("Use "):
+            return "no_tool", {}
+
+        tool_name, _, rest = action[4:].partition(" ")
+        if not tool_name:
             return "no_tool", {}
 
-        tool_name = parts[1]
         # Extract parameters from the rest of the thought
-        params = {"goal": " ".join(parts[4:])}
+        _, _, goal = rest.partition("goal: ")
+        params = {"goal": goal}
 
         return tool_name, params
 
@@ -2,18 +2,35 @@
 Self-Reflective Agent implementation.
 """
 
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List
+from itertools import islice
+from time import monotonic_ns
+from typing import Any, Deque, Dict, List
 
 from .base import BaseAgent
 
+# Upper bound on how much of an experience's context is quoted in a lesson
+_MAX_CTX_REPR = 120
 
-@dataclass
+
+def _brief(context: Dict[str, Any]) -> str:
+    """Render a context for a lesson, truncated to _MAX_CTX_REPR chars."""
+    text = repr(context)
+    if len(text) <= _MAX_CTX_REPR:
+        return text
+    return text[:_MAX_CTX_REPR] + "..."
+
+
+@dataclass(slots=True)
 class Experience:
-    """A record of an agent's experience."""
+    """A record of an agent's experience.
 
-    timestamp: datetime
+    ``timestamp`` is a ``time.monotonic_ns()`` reading, not wall-clock time; it
+    only orders experiences relative to each other within one process.
+    """
+
+    timestamp: int
     action: str
     context: Dict[str, Any]
     outcome: Dict[str, Any]
@@ -25,29 +42,39 @@ class ExperienceMemory:
     """A memory system for storing and retrieving experiences."""
 
     def __init__(self, max_size: int = 1000):
-        self.experiences: List[Experience] = []
+        # A bounded deque evicts the oldest experience in O(1) once full
+        self.experiences: Deque[Experience] = deque(maxlen=max_size)
         self.max_size = max_size
+        # Reference counts of lessons across stored experiences, kept in step
+        # with additions and evictions so lookups never rescan the memory
+        self._lessons: Counter[str] = Counter()
 
     def add(self, experience: Experience):
         """Add a new experience to memory."""
+        if len(self.experiences) == self.max_size:
+            self._forget_lessons(self.experiences[0])
         self.experiences.append(experience)
-        if len(self.experiences) > self.max_size:
-            self.experiences.pop(0)
+        self._lessons.update(experience.lessons_learned)
+
+    def _forget_lessons(self, experience: Experience):
+        """Drop an evicted experience's contribution to the lesson counts."""
+        for lesson in experience.lessons_learned:
+            self._lessons[lesson] -= 1
+            if self._lessons[lesson] <= 0:
+                del self._lessons[lesson]
 
     def get_similar_experiences(
         self, context: Dict[str, Any], limit: int = 5
     ) -> List[Experience]:
         """Retrieve experiences similar to the given context."""
         # In practice, this would use more sophisticated similarity matching
-        # For now, we'll just return the most recent experiences
-        return sorted(self.experiences, key=lambda x: x.timestamp, reverse=True)[:limit]
+        # For now, we'll just return the most recent experiences. Experiences are
+        # appended in chronological order, so the newest sit at the right end.
+        return list(islice(reversed(self.experiences), limit))
 
     def get_lessons_learned(self) -> List[str]:
         """Get all unique lessons learned from experiences."""
-        lessons = set()
-        for exp in self.experiences:
-            lessons.update(exp.lessons_learned)
-        return list(lessons)
+        return list(self._lessons)
 
 
 class SelfReflectiveAgent(BaseAgent):
@@ -106,7 +133,7 @@ class SelfReflectiveAgent(BaseAgent):
 
         # Record the experience
         experience = Experience(
-            timestamp=datetime.now(),
+            timestamp=monotonic_ns(),
             action=action,
             context={"thoughts": thoughts},
             outcome={"success": success, "result": result},
@@ -189,12 +216,12 @@ class SelfReflectiveAgent(BaseAgent):
         if experience.outcome.get("success", False):
             lessons.append(
                 f"Successful approach: {experience.action} "
-                f"in context: {experience.context}"
+                f"in context: {_brief(experience.context)}"
             )
         else:
             lessons.append(
                 f"Approach to avoid: {experience.action} "
-                f"in context: {experience.context}"
+                f"in context: {_brief(experience.context)}"
             )
 
         return lessons
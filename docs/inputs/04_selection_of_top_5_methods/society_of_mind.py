@@ -2,26 +2,39 @@
 Society of Mind (SoM) implementation.
 """
 
-from typing import Any, Dict, List
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
 
 from .base import BaseAgent
 
+_CONFIDENCE = itemgetter("confidence")
+
+
+@lru_cache(maxsize=None)
+def _think_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by every SocietyOfMindAgent, created on first use."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="som-think")
+
 
 class SubAgent(BaseAgent):
     """A specialized agent that focuses on a specific aspect of problem-solving."""
 
     def __init__(self, name: str, specialty: str):
         super().__init__(name)
-        self.specialty = specialty
+        # Interned so specialty-keyed dict lookups can short-circuit on identity
+        self.specialty = sys.intern(specialty)
         self.confidence_threshold = 0.7
+        # Per-agent invariant thought fragments, built once
+        self._think_header = sys.intern(f"Analyzing from {self.specialty} perspective:")
+        self._analyze_prefix = f"Based on {self.specialty}, I recommend: "
 
     def think(self, input_data: Dict[str, Any]) -> List[str]:
         """Generate thoughts related to this agent's specialty."""
-        thoughts = [
-            f"Analyzing from {self.specialty} perspective:",
-            self._analyze_specialty(input_data),
-        ]
-        return thoughts
+        return [self._think_header, sys.intern(self._analyze_specialty(input_data))]
 
     def act(self, thoughts: List[str]) -> Dict[str, Any]:
         """Provide specialized recommendations based on thoughts."""
@@ -34,7 +47,7 @@ class SubAgent(BaseAgent):
     def _analyze_specialty(self, input_data: Dict[str, Any]) -> str:
         """Analyze the input from this agent's specialized perspective."""
         # In practice, this would contain specialized logic for each type of agent
-        return f"Based on {self.specialty}, I recommend: {input_data}"
+        return self._analyze_prefix + str(input_data)
 
     def _calculate_confidence(self, thoughts: List[str]) -> float:
         """Calculate confidence in the recommendation."""
@@ -71,41 +84,74 @@ class SocietyOfMindAgent(BaseAgent):
         """Add a new sub-agent to the society."""
         self.sub_agents.append(agent)
 
+    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Think once per sub-agent and hand those thoughts straight to act."""
+        agent_thoughts = self._collect_agent_thoughts(input_data)
+        thoughts = self._compose_thoughts(agent_thoughts)
+        return self.act(thoughts, agent_thoughts)
+
     def think(self, input_data: Dict[str, Any]) -> List[str]:
         """
         Coordinate thinking across all sub-agents and synthesize their thoughts.
         """
-        thoughts = [f"Processing input with {len(self.sub_agents)} sub-agents"]
-
-        # Collect thoughts from all sub-agents
-        agent_thoughts = {}
-        for agent in self.sub_agents:
-            agent_thoughts[agent.specialty] = agent.think(input_data)
-
-        # Synthesize thoughts
-        synthesis = self._synthesize_thoughts(agent_thoughts)
-        thoughts.extend(synthesis)
+        return self._compose_thoughts(self._collect_agent_thoughts(input_data))
+
+    def _collect_agent_thoughts(
+        self, input_data: Dict[str, Any]
+    ) -> Dict[str, List[str]]:
+        """Collect thoughts from all sub-agents in parallel, keyed by specialty."""
+        # Sub-agents think independently, so their thinking is fanned out
+        executor = _think_executor()
+        futures = [
+            executor.submit(agent.think, input_data) for agent in self.sub_agents
+        ]
+        return {
+            agent.specialty: future.result()
+            for agent, future in zip(self.sub_agents, futures)
+        }
 
+    def _compose_thoughts(self, agent_thoughts: Dict[str, List[str]]) -> List[str]:
+        """Prefix the synthesized sub-agent thoughts with a society header."""
+        thoughts = [f"Processing input with {len(self.sub_agents)} sub-agents"]
+        thoughts.extend(self._synthesize_thoughts(agent_thoughts))
         return thoughts
 
-    def act(self, thoughts: List[str]) -> Dict[str, Any]:
+    def act(
+        self,
+        thoughts: List[str],
+        agent_thoughts: Optional[Dict[str, List[str]]] = None,
+    ) -> Dict[str, Any]:
         """
         Coordinate actions based on collective thinking of sub-agents.
+
+        When ``agent_thoughts`` from a preceding think pass is supplied, each
+        sub-agent acts on its own prior thoughts instead of thinking again.
         """
         # Collect recommendations from all sub-agents
+        agent_thoughts = agent_thoughts or {}
         recommendations = []
         for agent in self.sub_agents:
-            result = agent.act(agent.think({"thoughts": thoughts}))
+            own_thoughts = agent_thoughts.get(agent.specialty)
+            if own_thoughts is None:
+                own_thoughts = agent.think({"thoughts": thoughts})
+            result = agent.act(own_thoughts)
             if result["confidence"] >= agent.confidence_threshold:
                 recommendations.append(result)
 
+        # Sort once by confidence; both summaries only need the top entries
+        recommendations.sort(key=_CONFIDENCE, reverse=True)
+
         # Synthesize recommendations into final action
-        final_action = self._synthesize_recommendations(recommendations)
+        final_action = self._synthesize_recommendations(
+            recommendations, pre_sorted=True
+        )
 
         return {
             "collective_action": final_action,
             "individual_recommendations": recommendations,
-            "confidence": self._calculate_collective_confidence(recommendations),
+            "confidence": self._calculate_collective_confidence(
+                recommendations, pre_sorted=True
+            ),
         }
 
     def _synthesize_thoughts(self, agent_thoughts: Dict[str, List[str]]) -> List[str]:
@@ -123,13 +169,16 @@ class SocietyOfMindAgent(BaseAgent):
 
         return synthesis
 
-    def _synthesize_recommendations(self, recommendations: List[Dict[str, Any]]) -> str:
+    def _synthesize_recommendations(
+        self, recommendations: List[Dict[str, Any]], pre_sorted: bool = False
+    ) -> str:
         """Synthesize individual recommendations into a collective action."""
         if not recommendations:
             return "No confident recommendations available"
 
         # Sort by confidence
-        recommendations.sort(key=lambda x: x["confidence"], reverse=True)
+        if not pre_sorted:
+            recommendations.sort(key=_CONFIDENCE, reverse=True)
 
         # Combine top recommendations
         top_recommendations = recommendations[:3]
@@ -141,28 +190,34 @@ class SocietyOfMindAgent(BaseAgent):
         return synthesis
 
     def _calculate_collective_confidence(
-        self, recommendations: List[Dict[str, Any]]
+        self, recommendations: List[Dict[str, Any]], pre_sorted: bool = False
     ) -> float:
         """Calculate overall confidence based on individual recommendations."""
         if not recommendations:
             return 0.0
 
         # Average confidence of top 3 recommendations
-        top_confidences = sorted(
-            [r["confidence"] for r in recommendations], reverse=True
-        )[:3]
+        if pre_sorted:
+            top_confidences = [r["confidence"] for r in recommendations[:3]]
+        else:
+            top_confidences = sorted(
+                [r["confidence"] for r in recommendations], reverse=True
+            )[:3]
         return sum(top_confidences) / len(top_confidences) if top_confidences else 0.0
 
     def _create_overall_synthesis(self, agent_thoughts: Dict[str, List[str]]) -> str:
         """Create an overall synthesis of all agent thoughts."""
         # Count common themes/recommendations
-        themes = {}
-        for thoughts in agent_thoughts.values():
-            for thought in thoughts:
-                themes[thought] = themes.get(thought, 0) + 1
+        # Interning collapses duplicate thoughts to one object, so the Counter's
+        # key comparisons short-circuit on identity
+        themes = Counter(
+            sys.intern(thought)
+            for thoughts in agent_thoughts.values()
+            for thought in thoughts
+        )
 
-        # Find most common themes
-        common_themes = sorted(themes.items(), key=lambda x: x[1], reverse=True)
+        # Find the most common theme
+        common_themes = themes.most_common(1)
 
         if not common_themes:
             return "No common themes found"
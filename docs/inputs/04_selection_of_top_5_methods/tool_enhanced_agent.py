@@ -2,9 +2,42 @@
 Tool-Use Enhanced Agent implementation.
 """
 
-from typing import Any, Dict, List, Optional
+import ast
+import operator
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from .base import BaseAgent, Tool
+import numpy as np
+
+from .base import BaseAgent, Tool, ToolError
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to a vectorized NumPy check
+    njit = None
+
+
+def _hash_tokens(text: str) -> np.ndarray:
+    """Hash the unique lowercased words of a text into an int64 array."""
+    return np.fromiter({hash(word) for word in text.lower().split()}, np.int64)
+
+
+def _shares_token_kernel(task_hashes: np.ndarray, desc_hashes: np.ndarray) -> bool:
+    """Whether the task and a tool description have any word in common."""
+    for task_hash in task_hashes:
+        for desc_hash in desc_hashes:
+            if task_hash == desc_hash:
+                return True
+    return False
+
+
+if njit is not None:
+    _shares_token = njit(cache=True)(_shares_token_kernel)
+else:
+
+    def _shares_token(task_hashes: np.ndarray, desc_hashes: np.ndarray) -> bool:
+        return bool(np.isin(task_hashes, desc_hashes).any())
 
 
 class ToolRegistry:
@@ -12,10 +45,15 @@ class ToolRegistry:
 
     def __init__(self):
         self.tools: Dict[str, Tool] = {}
+        self._desc_cache: Optional[Mapping[str, str]] = None
+        # Hashed description words per tool, for relevance matching
+        self._desc_hashes: Dict[str, np.ndarray] = {}
 
     def register(self, tool: Tool):
         """Register a new tool."""
         self.tools[tool.name] = tool
+        self._desc_cache = None
+        self._desc_hashes[tool.name] = _hash_tokens(tool.description)
 
     def get_tool(self, name: str) -> Optional[Tool]:
         """Get a tool by name."""
@@ -25,9 +63,17 @@ class ToolRegistry:
         """List all available tool names."""
         return list(self.tools.keys())
 
-    def get_descriptions(self) -> Dict[str, str]:
-        """Get descriptions of all tools."""
-        return {name: tool.description for name, tool in self.tools.items()}
+    def get_descriptions(self) -> Mapping[str, str]:
+        """Get descriptions of all tools, cached until the next registration."""
+        if self._desc_cache is None:
+            self._desc_cache = MappingProxyType(
+                {name: tool.description for name, tool in self.tools.items()}
+            )
+        return self._desc_cache
+
+    def get_description_hashes(self, name: str) -> np.ndarray:
+        """Get the hashed description words of a registered tool."""
+        return self._desc_hashes[name]
 
 
 class ToolEnhancedAgent(BaseAgent):
@@ -40,6 +86,8 @@ class ToolEnhancedAgent(BaseAgent):
         self.tool_registry = ToolRegistry()
         self.max_tool_attempts = 3
         self.tool_history: List[Dict[str, Any]] = []
+        # Structured (tool name, params) plan from the last think(), consumed by act()
+        self._pending_plan: List[Tuple[str, Dict[str, Any]]] = []
 
     def register_tool(self, tool: Tool):
         """Register a new tool for the agent to use."""
@@ -76,8 +124,8 @@ class ToolEnhancedAgent(BaseAgent):
         error = None
 
         try:
-            # Extract tool usage plan from thoughts
-            tool_sequence = self._extract_tool_sequence(thoughts)
+            # Take the tool usage plan prepared while thinking
+            tool_sequence = self._extract_tool_sequence()
 
             # Execute each tool in sequence
             for tool_name, params in tool_sequence:
@@ -106,7 +154,7 @@ class ToolEnhancedAgent(BaseAgent):
             "thoughts": thoughts,
         }
 
-    def _plan_tool_usage(self, task: str, tools: Dict[str, str]) -> List[str]:
+    def _plan_tool_usage(self, task: str, tools: Mapping[str, str]) -> List[str]:
         """Plan how to use available tools to accomplish the task."""
         thoughts = []
 
@@ -115,8 +163,10 @@ class ToolEnhancedAgent(BaseAgent):
 
         # Match tools to requirements
         thoughts.append("Matching tools to requirements:")
-        for name, description in tools.items():
-            relevance = self._assess_tool_relevance(task, name, description)
+        task_hashes = _hash_tokens(task)
+        for name in tools:
+            desc_hashes = self.tool_registry.get_description_hashes(name)
+            relevance = self._assess_tool_relevance(task_hashes, desc_hashes)
             thoughts.append(f"- {name}: Relevance = {relevance}")
 
         # Create execution plan
@@ -127,57 +177,87 @@ class ToolEnhancedAgent(BaseAgent):
         return thoughts
 
     def _assess_tool_relevance(
-        self, task: str, tool_name: str, tool_description: str
+        self, task_hashes: np.ndarray, desc_hashes: np.ndarray
     ) -> float:
         """Assess how relevant a tool is for the given task."""
         # In practice, this would use more sophisticated relevance assessment
         # possibly using semantic similarity or ML-based matching
-        if any(word in tool_description.lower() for word in task.lower().split()):
+        if _shares_token(task_hashes, desc_hashes):
             return 0.8
         return 0.2
 
     def _create_tool_execution_plan(
-        self, task: str, tools: Dict[str, str]
+        self, task: str, tools: Mapping[str, str]
     ) -> List[str]:
-        """Create a plan for tool execution."""
+        """
+        Create a plan for tool execution.
+
+        The structured plan is stored for act(); the returned steps are only a
+        human-readable rendering of it for the thought log.
+        """
         # In practice, this would use more sophisticated planning
-        plan = []
-        for name in tools:
-            plan.append(f"Step: Use {name} to process task")
-        return plan
-
-    def _extract_tool_sequence(
-        self, thoughts: List[str]
-    ) -> List[tuple[str, Dict[str, Any]]]:
-        """Extract tool sequence from thoughts."""
-        sequence = []
-        for thought in thoughts:
-            if thought.startswith("Step: Use"):
-                # Parse tool name and create basic parameters
-                parts = thought.split()
-                tool_name = parts[2]
-                sequence.append((tool_name, {"task": " ".join(parts[4:])}))
+        self._pending_plan = [(name, {"task": task}) for name in tools]
+        return [f"Step: Use {name} to process task" for name, _ in self._pending_plan]
+
+    def _extract_tool_sequence(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Hand over the pending tool sequence and reset it."""
+        sequence = self._pending_plan
+        self._pending_plan = []
         return sequence
 
     def _execute_tool_safely(self, tool: Tool, params: Dict[str, Any]) -> Any:
-        """Execute a tool with safety checks and retries."""
-        attempts = 0
+        """
+        Execute a tool with safety checks and retries.
+
+        Only ``ToolError`` failures are retried; any other exception propagates
+        immediately.
+        """
         last_error = None
 
-        while attempts < self.max_tool_attempts:
+        for _ in range(self.max_tool_attempts):
             try:
                 return tool.execute(params)
-            except Exception as e:
+            except ToolError as e:
                 last_error = e
-                attempts += 1
 
-        raise Exception(
-            f"Tool execution failed after {attempts} attempts: {last_error}"
-        )
+        # The cause is chained rather than formatted into the message, so it is
+        # only rendered if the traceback is actually displayed
+        raise ToolError(
+            f"Tool execution failed after {self.max_tool_attempts} attempts"
+        ) from last_error
 
 
 # Example tool implementations
 
+# Arithmetic operators the calculator tool is allowed to evaluate
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+@lru_cache(maxsize=1024)
+def _parse_expression(expression: str) -> ast.expr:
+    """Parse an arithmetic expression once; repeated expressions hit the cache."""
+    return ast.parse(expression, mode="eval").body
+
+
+def _evaluate(node: ast.expr) -> Any:
+    """Evaluate a parsed arithmetic expression without invoking eval()."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        return _BIN_OPS[type(node.op)](_evaluate(node.left), _evaluate(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_evaluate(node.operand))
+    raise ValueError(f"Unsupported expression element: {ast.dump(node)}")
+
 
 class WebSearchTool(Tool):
     """A tool for performing web searches."""
@@ -206,6 +286,6 @@ class CalculatorTool(Tool):
         # Implement actual calculation logic
         expression = params.get("expression", "")
         try:
-            return eval(expression)  # Note: eval is used for demonstration only
+            return _evaluate(_parse_expression(expression))
         except Exception as e:
             return f"Error calculating {expression}: {str(e)}"
@@ -5,8 +5,13 @@ This module implements a basic Chain-of-Thought (CoT) reasoning mechanism that b
 complex problems into manageable components for better problem decomposition and logical reasoning.
 """
 
+import io
+import re
 from typing import List
 
+# Sentence boundaries used to split a question into subproblems
+_SENT_RE = re.compile(r"[.?!]+")
+
 
 class ChainOfThoughtAgent:
     """
@@ -16,7 +21,8 @@ class ChainOfThoughtAgent:
 
     def __init__(self, name: str = "CoTAgent"):
         self.name = name
-        self.thought_chain: List[str] = []
+        # Thought chain is written straight into a text buffer, one line per thought
+        self._thought_buffer = io.StringIO()
 
     def reason(self, question: str) -> str:
         """
@@ -29,22 +35,22 @@ class ChainOfThoughtAgent:
             str: The final answer derived via step-by-step reasoning.
         """
         # Clear previous thought chain
-        self.thought_chain.clear()
+        self._thought_buffer = io.StringIO()
 
         # Step 1: Break down the question
         subproblems = self._decompose_question(question)
-        self.thought_chain.append(f"Breaking down question: {question}")
+        self._add_thought(f"Breaking down question: {question}")
 
         # Step 2: Solve each subproblem step-by-step
         solutions = []
         for step_index, sp in enumerate(subproblems, 1):
             thought = self._solve_subproblem(sp, step_index)
-            self.thought_chain.append(f"Step {step_index}: {thought}")
+            self._add_thought(f"Step {step_index}: {thought}")
             solutions.append(thought)
 
         # Step 3: Combine the solutions into a final answer
         final_answer = self._combine_solutions(solutions)
-        self.thought_chain.append(f"Final answer: {final_answer}")
+        self._add_thought(f"Final answer: {final_answer}")
 
         return self._format_response()
 
@@ -58,8 +64,8 @@ class ChainOfThoughtAgent:
         Returns:
             List[str]: List of subproblems.
         """
-        # Example heuristic: split by punctuation or keywords
-        return [q.strip() for q in question.split(".") if q.strip()]
+        # Example heuristic: split by sentence-ending punctuation
+        return [part for part in map(str.strip, _SENT_RE.split(question)) if part]
 
     def _solve_subproblem(self, subproblem: str, step_index: int) -> str:
         """
@@ -84,8 +90,19 @@ class ChainOfThoughtAgent:
         Returns:
             str: Combined solution.
         """
+        # Fast paths for the common zero- and single-solution cases
+        if not solutions:
+            return ""
+        if len(solutions) == 1:
+            return solutions[0]
         return " Therefore, ".join(solutions)
 
+    def _add_thought(self, thought: str):
+        """Appends a thought to the chain, newline-separated from the previous one."""
+        if self._thought_buffer.tell():
+            self._thought_buffer.write("\n")
+        self._thought_buffer.write(thought)
+
     def _format_response(self) -> str:
         """
         Formats the complete thought chain and final answer into a readable response.
@@ -93,7 +110,7 @@ class ChainOfThoughtAgent:
         Returns:
             str: Formatted response with thought chain and final answer.
         """
-        return "\n".join(self.thought_chain)
+        return self._thought_buffer.getvalue()
 
 
 if __name__ == "__main__":
@@ -16,7 +16,14 @@ class StepType(Enum):
     OBSERVATION = auto()
 
 
-@dataclass
+# Display prefix per step type, indexed by ``StepType.value - 1``
+_PREFIXES = ("🤔 Thought:", "🎯 Action:", "👁 Observed:")
+
+# Bit ``1 << StepType.value`` is set once a step of that type is seen; bit 0 unused
+_ALL_MASK = (1 << (len(StepType) + 1)) - 2
+
+
+@dataclass(slots=True)
 class Step:
     """Represents a single step in the ReAct process."""
 
@@ -34,6 +41,7 @@ class ReActAgent:
         self.name = name
         self.steps: List[Step] = []
         self.max_steps = 10  # Prevent infinite loops
+        self._seen_mask = 0
 
     def engage(self, task: str) -> str:
         """
@@ -47,6 +55,7 @@ class ReActAgent:
             str: The final result after completing the task.
         """
         self.steps.clear()
+        self._seen_mask = 0
 
         # Initial thought about the task
         self._add_thought(f"Analyzing task: {task}")
@@ -68,14 +77,17 @@ class ReActAgent:
     def _add_thought(self, thought: str):
         """Records a thinking step."""
         self.steps.append(Step(StepType.THOUGHT, thought))
+        self._seen_mask |= 1 << StepType.THOUGHT.value
 
     def _add_action(self, action: str):
         """Records an action step."""
         self.steps.append(Step(StepType.ACTION, action))
+        self._seen_mask |= 1 << StepType.ACTION.value
 
     def _add_observation(self, observation: str):
         """Records an observation step."""
         self.steps.append(Step(StepType.OBSERVATION, observation))
+        self._seen_mask |= 1 << StepType.OBSERVATION.value
 
     def _is_task_complete(self) -> bool:
         """
@@ -85,8 +97,7 @@ class ReActAgent:
             bool: True if task is complete, False otherwise.
         """
         # Example implementation: complete if we have at least one of each step type
-        step_types = {step.type for step in self.steps}
-        return len(step_types) >= len(StepType)
+        return self._seen_mask == _ALL_MASK
 
     def _plan_next_action(self, task: str) -> str:
         """
@@ -125,12 +136,7 @@ class ReActAgent:
         """
         formatted_steps = []
         for step in self.steps:
-            prefix = {
-                StepType.THOUGHT: "🤔 Thought:",
-                StepType.ACTION: "🎯 Action:",
-                StepType.OBSERVATION: "👁 Observed:",
-            }[step.type]
-            formatted_steps.append(f"{prefix} {step.content}")
+            formatted_steps.append(f"{_PREFIXES[step.type.value - 1]} {step.content}")
 
         return "\n".join(formatted_steps)
 
@@ -5,9 +5,11 @@ This module implements a simplified version of Marvin Minsky's Society of Mind c
 where multiple specialized sub-agents work together to solve complex tasks.
 """
 
+import io
+import re
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Callable, List
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set
 
 
 class Specialty(Enum):
@@ -20,7 +22,47 @@ class Specialty(Enum):
     PLANNING = auto()
 
 
-@dataclass
+# Keywords that signal a task falls within each specialty
+_SPECIALTY_KEYWORDS: Dict[Specialty, FrozenSet[str]] = {
+    Specialty.MATH: frozenset({"calculate", "compute", "solve", "number"}),
+    Specialty.LANGUAGE: frozenset({"explain", "describe", "write", "translate"}),
+    Specialty.LOGIC: frozenset({"reason", "deduce", "analyze", "if", "then"}),
+    Specialty.MEMORY: frozenset({"recall", "remember", "store", "retrieve"}),
+    Specialty.PLANNING: frozenset({"plan", "organize", "schedule", "arrange"}),
+}
+
+# Inverted index: keyword -> specialties it signals, so a task can be routed to
+# every matching specialty in a single pass over its words
+_KEYWORD_SPECIALTIES: Dict[str, FrozenSet[Specialty]] = {
+    keyword: frozenset(
+        specialty
+        for specialty, keywords in _SPECIALTY_KEYWORDS.items()
+        if keyword in keywords
+    )
+    for keywords in _SPECIALTY_KEYWORDS.values()
+    for keyword in keywords
+}
+
+
+_WORD = re.compile(r"[a-z]+")
+
+
+def _task_words(task: str) -> List[str]:
+    """Lowercased words of a task, with punctuation and digits dropped."""
+    return _WORD.findall(task.lower())
+
+
+def _match_specialties(task: str) -> Set[Specialty]:
+    """Returns every specialty whose keywords appear among the task's words."""
+    matched: Set[Specialty] = set()
+    for word in _task_words(task):
+        specialties = _KEYWORD_SPECIALTIES.get(word)
+        if specialties:
+            matched.update(specialties)
+    return matched
+
+
+@dataclass(slots=True)
 class SubAgent:
     """
     Represents a specialized agent within the society.
@@ -32,27 +74,22 @@ class SubAgent:
     solve_func: Callable[[str], str]
     confidence_threshold: float = 0.7
 
-    def can_handle(self, task: str) -> bool:
+    def can_handle(self, task: str, task_words: Optional[Set[str]] = None) -> bool:
         """
         Determines if this sub-agent can handle a given task.
 
         Args:
             task (str): The task to evaluate.
+            task_words (Optional[Set[str]]): Lowercased words of the task, if the
+                caller has already tokenized it.
 
         Returns:
             bool: True if the agent can handle the task.
         """
         # Example implementation - in practice, this would be more sophisticated
-        specialty_keywords = {
-            Specialty.MATH: ["calculate", "compute", "solve", "number"],
-            Specialty.LANGUAGE: ["explain", "describe", "write", "translate"],
-            Specialty.LOGIC: ["reason", "deduce", "analyze", "if", "then"],
-            Specialty.MEMORY: ["recall", "remember", "store", "retrieve"],
-            Specialty.PLANNING: ["plan", "organize", "schedule", "arrange"],
-        }
-
-        keywords = specialty_keywords[self.specialty]
-        return any(keyword in task.lower() for keyword in keywords)
+        if task_words is None:
+            task_words = set(_task_words(task))
+        return not _SPECIALTY_KEYWORDS[self.specialty].isdisjoint(task_words)
 
     def solve(self, task: str) -> str:
         """
@@ -66,6 +103,10 @@ class SubAgent:
         """
         if not self.can_handle(task):
             return f"[{self.name}] Cannot confidently handle: {task}"
+        return self._solve_unchecked(task)
+
+    def _solve_unchecked(self, task: str) -> str:
+        """Solves a task the caller has already matched to this specialty."""
         return self.solve_func(task)
 
 
@@ -75,10 +116,13 @@ class SocietyOfMind:
     to solve complex problems through collaboration.
     """
 
-    def __init__(self, name: str = "SoMManager"):
+    def __init__(self, name: str = "SoMManager", verbose: bool = True):
         self.name = name
+        # When False, no solution history is recorded or formatted
+        self.verbose = verbose
         self.subagents: List[SubAgent] = []
-        self.solution_history: List[str] = []
+        # Solution history is written straight into a text buffer, one line per entry
+        self._history_buffer = io.StringIO()
 
     def add_subagent(self, subagent: SubAgent):
         """
@@ -97,29 +141,31 @@ class SocietyOfMind:
             task (str): The complex task to solve.
 
         Returns:
-            str: The combined solution from all relevant sub-agents.
+            str: The solution history, or only the combined solution from all
+                relevant sub-agents when the society is not verbose.
         """
-        self.solution_history.clear()
-        self._log(f"Received task: {task}")
-
-        # Find capable agents
-        capable_agents = [agent for agent in self.subagents if agent.can_handle(task)]
-
-        if not capable_agents:
+        self._history_buffer = io.StringIO()
+        self._log("Received task: %s", task)
+
+        # Collect solutions from capable agents; the task has already been
+        # matched, so agents need not re-check it
+        matched = _match_specialties(task)
+        capable_agents = [
+            agent for agent in self.subagents if agent.specialty in matched
+        ]
+        solutions = [agent._solve_unchecked(task) for agent in capable_agents]
+
+        if not solutions:
             return f"No agents available to handle task: {task}"
 
-        # Collect solutions from capable agents
-        solutions = []
-        for agent in capable_agents:
-            solution = agent.solve(task)
-            self._log(f"Agent {agent.name} ({agent.specialty.name}): {solution}")
-            solutions.append(solution)
+        for agent, solution in zip(capable_agents, solutions):
+            self._log("Agent %s (%s): %s", agent.name, agent.specialty.name, solution)
 
         # Combine solutions
         final_solution = self._synthesize_solutions(solutions)
-        self._log(f"Final synthesized solution: {final_solution}")
+        self._log("Final synthesized solution: %s", final_solution)
 
-        return self._format_response()
+        return self._format_response() if self.verbose else final_solution
 
     def _synthesize_solutions(self, solutions: List[str]) -> str:
         """
@@ -131,11 +177,23 @@ class SocietyOfMind:
         Returns:
             str: Synthesized solution.
         """
+        # Fast paths for the common zero- and single-solution cases
+        if not solutions:
+            return ""
+        if len(solutions) == 1:
+            return solutions[0]
         return " | ".join(solutions)
 
-    def _log(self, message: str):
-        """Records a step in the solution process."""
-        self.solution_history.append(message)
+    def _log(self, fmt: str, *args: Any):
+        """
+        Records a step in the solution process. The message is only formatted
+        when the society is verbose.
+        """
+        if not self.verbose:
+            return
+        if self._history_buffer.tell():
+            self._history_buffer.write("\n")
+        self._history_buffer.write(fmt % args)
 
     def _format_response(self) -> str:
         """
@@ -144,7 +202,7 @@ class SocietyOfMind:
         Returns:
             str: Formatted solution history.
         """
-        return "\n".join(self.solution_history)
+        return self._history_buffer.getvalue()
 
 
 def example_math_solver(task: str) -> str:
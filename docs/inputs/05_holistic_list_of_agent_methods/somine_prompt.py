@@ -9,6 +9,27 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from typing import List, Optional
 
+# Phase templates; only the context is substituted per call
+_SOCRATIC_TEMPLATE = (
+    "- What are the key assumptions in '{ctx}'?\n"
+    "- What information might be missing?\n"
+    "- What constraints should we consider?\n"
+    "- What are the potential edge cases?"
+)
+_INSTRUCTIONS_TEMPLATE = (
+    "1. Parse the context: '{ctx}'\n"
+    "2. Identify core requirements\n"
+    "3. Plan minimal steps needed\n"
+    "4. Execute with precision"
+)
+_FINAL_ANSWER_TEMPLATE = (
+    "Based on the analysis of '{ctx}':\n"
+    "1. Key insights were identified through questioning\n"
+    "2. Core requirements were distilled\n"
+    "3. Process was reviewed for completeness\n"
+    "4. Solution addresses all major points"
+)
+
 
 class PromptPhase(Enum):
     """Defines the different phases of the SoMinE process."""
@@ -19,7 +40,11 @@ class PromptPhase(Enum):
     FINAL_ANSWER = auto()
 
 
-@dataclass
+# Display title per phase, e.g. SOCRATIC_INQUIRY -> "Socratic Inquiry"
+_PHASE_TITLE = {phase: phase.name.replace("_", " ").title() for phase in PromptPhase}
+
+
+@dataclass(slots=True)
 class PromptStep:
     """Represents a single step in the SoMinE process."""
 
@@ -79,13 +104,7 @@ class SoMinEPrompt:
         Returns:
             str: A set of relevant questions.
         """
-        questions = [
-            f"What are the key assumptions in '{self.context}'?",
-            "What information might be missing?",
-            "What constraints should we consider?",
-            "What are the potential edge cases?",
-        ]
-        return "\n".join(f"- {q}" for q in questions)
+        return _SOCRATIC_TEMPLATE.format_map({"ctx": self.context})
 
     def _generate_minimal_instructions(self) -> str:
         """
@@ -94,12 +113,7 @@ class SoMinEPrompt:
         Returns:
             str: Minimal set of instructions.
         """
-        return (
-            f"1. Parse the context: '{self.context}'\n"
-            "2. Identify core requirements\n"
-            "3. Plan minimal steps needed\n"
-            "4. Execute with precision"
-        )
+        return _INSTRUCTIONS_TEMPLATE.format_map({"ctx": self.context})
 
     def _reflect_on_process(self) -> str:
         """
@@ -122,13 +136,7 @@ class SoMinEPrompt:
         Returns:
             str: The final answer.
         """
-        return (
-            f"Based on the analysis of '{self.context}':\n"
-            "1. Key insights were identified through questioning\n"
-            "2. Core requirements were distilled\n"
-            "3. Process was reviewed for completeness\n"
-            "4. Solution addresses all major points"
-        )
+        return _FINAL_ANSWER_TEMPLATE.format_map({"ctx": self.context})
 
     def _add_step(self, content: str):
         """
@@ -149,8 +157,9 @@ class SoMinEPrompt:
         """
         formatted_steps = []
         for step in self.steps:
-            phase_name = step.phase.name.replace("_", " ").title()
-            formatted_steps.append(f"\n=== {phase_name} ===\n{step.content}")
+            formatted_steps.append(
+                f"\n=== {_PHASE_TITLE[step.phase]} ===\n{step.content}"
+            )
 
         return "\n".join(formatted_steps)
 
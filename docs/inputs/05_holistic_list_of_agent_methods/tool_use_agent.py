@@ -6,12 +6,63 @@ various tools (e.g., calculators, search engines, APIs) to solve tasks more effe
 """
 
 import re
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional
+from enum import IntEnum, auto
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to a combined regex
+    ahocorasick = None
+
+# Keywords that signal each tool is needed, in the order tools are reported
+# Example pattern matching - in practice, use more sophisticated NLP
+_TOOL_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "calculator": ("calculate", "compute", "sum", "multiply", "divide"),
+    "search": ("search", "find", "lookup", "query"),
+    "api": ("api", "fetch", "request", "call"),
+    "database": ("database", "db", "store", "retrieve"),
+    "file": ("file", "read", "write", "save"),
+}
+_KEYWORD_TOOL = {
+    keyword: tool_name
+    for tool_name, keywords in _TOOL_KEYWORDS.items()
+    for keyword in keywords
+}
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _tool_name in _KEYWORD_TOOL.items():
+        _KEYWORD_AUTOMATON.add_word(_keyword, _tool_name)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+    def _match_tools(text: str) -> Set[str]:
+        """Names of tools whose keywords occur anywhere in ``text``."""
+        found: Set[str] = set()
+        for _, tool_name in _KEYWORD_AUTOMATON.iter(text):
+            found.add(tool_name)
+            if len(found) == len(_TOOL_KEYWORDS):
+                break
+        return found
+
+else:
+    # Zero-width lookahead reports overlapping keyword hits, as the automaton does
+    _KEYWORD_RE = re.compile(
+        "(?=(" + "|".join(re.escape(keyword) for keyword in _KEYWORD_TOOL) + "))"
+    )
+
+    def _match_tools(text: str) -> Set[str]:
+        """Names of tools whose keywords occur anywhere in ``text``."""
+        found: Set[str] = set()
+        for match in _KEYWORD_RE.finditer(text):
+            found.add(_KEYWORD_TOOL[match.group(1)])
+            if len(found) == len(_TOOL_KEYWORDS):
+                break
+        return found
 
 
-class ToolCategory(Enum):
+class ToolCategory(IntEnum):
     """Categories of available tools."""
 
     CALCULATOR = auto()
@@ -41,6 +92,7 @@ class ToolRegistry:
     def __init__(self):
         self.tools: Dict[str, Tool] = {}
         self.usage_stats: Dict[str, int] = {}
+        self._by_category: Dict[ToolCategory, List[Tool]] = defaultdict(list)
 
     def register_tool(self, tool: Tool):
         """
@@ -49,8 +101,12 @@ class ToolRegistry:
         Args:
             tool (Tool): The tool to register.
         """
+        previous = self.tools.get(tool.name)
+        if previous is not None:
+            self._by_category[previous.category].remove(previous)
         self.tools[tool.name] = tool
         self.usage_stats[tool.name] = 0
+        self._by_category[tool.category].append(tool)
 
     def get_tool(self, name: str) -> Optional[Tool]:
         """
@@ -83,7 +139,7 @@ class ToolRegistry:
         Returns:
             List[Tool]: Tools in the specified category.
         """
-        return [tool for tool in self.tools.values() if tool.category == category]
+        return list(self._by_category.get(category, ()))
 
 
 class ToolUseAgent:
@@ -93,10 +149,11 @@ class ToolUseAgent:
     their outputs for comprehensive solutions.
     """
 
-    def __init__(self, name: str, registry: ToolRegistry):
+    def __init__(self, name: str, registry: ToolRegistry, max_history: int = 1024):
         self.name = name
         self.registry = registry
-        self.execution_history: List[str] = []
+        # Only the most recent entries are kept for long-running agents
+        self.execution_history: Deque[str] = deque(maxlen=max_history)
 
     def solve_task(self, task: str, **kwargs: Any) -> str:
         """
@@ -145,22 +202,9 @@ class ToolUseAgent:
         Returns:
             List[str]: Names of required tools.
         """
-        required_tools = []
-
-        # Example pattern matching - in practice, use more sophisticated NLP
-        patterns = {
-            "calculator": r"calculate|compute|sum|multiply|divide",
-            "search": r"search|find|lookup|query",
-            "api": r"api|fetch|request|call",
-            "database": r"database|db|store|retrieve",
-            "file": r"file|read|write|save",
-        }
-
-        for tool_name, pattern in patterns.items():
-            if re.search(pattern, task.lower()):
-                required_tools.append(tool_name)
-
-        return required_tools
+        # A single scan of the task finds every keyword hit
+        matched = _match_tools(task.lower())
+        return [tool_name for tool_name in _TOOL_KEYWORDS if tool_name in matched]
 
     def _execute_tool(self, tool: Tool, task: str, **kwargs: Any) -> Any:
         """
@@ -2,8 +2,9 @@
 SoMinE (Society of Mind-Inspired Engineering) Agent implementation.
 """
 
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Deque, List, Optional
 
 
 @dataclass
@@ -15,8 +16,11 @@ class SoMinEResponse:
 
 
 class SoMinEAgent:
+    # Number of most recent context entries retained across solves
+    CONTEXT_WINDOW = 256
+
     def __init__(self):
-        self.context = []
+        self.context: Deque[str] = deque(maxlen=self.CONTEXT_WINDOW)
 
     def generate_socratic_questions(self, problem: str) -> List[str]:
         """Generate clarifying questions about the problem."""
@@ -2,52 +2,125 @@
 Tree of Thoughts implementation for exploring multiple reasoning paths.
 """
 
-from dataclasses import dataclass
-from queue import PriorityQueue
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy as np
 
-@dataclass
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
+
+def _cosine_similarity_kernel(embedding: np.ndarray, reference: np.ndarray) -> float:
+    """Cosine similarity between a thought embedding and the reference vector."""
+    dot = 0.0
+    norm_e = 0.0
+    norm_r = 0.0
+    for i in range(embedding.shape[0]):
+        dot += embedding[i] * reference[i]
+        norm_e += embedding[i] * embedding[i]
+        norm_r += reference[i] * reference[i]
+    if norm_e == 0.0 or norm_r == 0.0:
+        return 0.0
+    return dot / (norm_e**0.5 * norm_r**0.5)
+
+
+if njit is not None:
+    # Explicit signature compiles eagerly and skips type inference
+    _score_kernel = njit("float32(float32[::1], float32[::1])", cache=True)(
+        _cosine_similarity_kernel
+    )
+else:
+
+    def _score_kernel(embedding: np.ndarray, reference: np.ndarray) -> float:
+        denom = np.linalg.norm(embedding) * np.linalg.norm(reference)
+        if denom == 0.0:
+            return 0.0
+        return float(np.dot(embedding, reference) / denom)
+
+
+@dataclass(slots=True)
 class Thought:
     content: str
     score: float
     parent: Optional["Thought"] = None
-    children: List["Thought"] = None
-
-    def __init__(self, content: str, score: float, parent: Optional["Thought"] = None):
-        self.content = content
-        self.score = score
-        self.parent = parent
-        self.children = []
+    children: List["Thought"] = field(default_factory=list)
 
     def __lt__(self, other):
         return self.score > other.score  # Higher scores have priority
 
 
 class TreeOfThoughts:
-    def __init__(self, max_depth: int = 5, beam_width: int = 3):
+    def __init__(
+        self,
+        max_depth: int = 5,
+        beam_width: int = 3,
+        reference: Optional[np.ndarray] = None,
+    ):
         self.max_depth = max_depth
         self.beam_width = beam_width
         self.root = None
+        self._reference = (
+            None
+            if reference is None
+            else np.ascontiguousarray(reference, dtype=np.float32)
+        )
 
     def generate_thoughts(self, current_thought: Thought) -> List[Thought]:
         """Generate possible next thoughts from current thought."""
         # In a real implementation, this would use an LLM to generate diverse thoughts
         return [Thought(f"Thought branch {i}", 0.5, current_thought) for i in range(3)]
 
+    def embed_thought(self, thought: Thought) -> Optional[np.ndarray]:
+        """Embed a thought for numeric scoring, or None if unavailable."""
+        # In a real implementation, this would call an embedding model
+        return None
+
     def evaluate_thought(self, thought: Thought) -> float:
         """Evaluate the quality of a thought."""
-        # In a real implementation, this would use an LLM or other metric
-        return 0.7  # Mock score
+        embedding = self.embed_thought(thought)
+        if embedding is None or self._reference is None:
+            # In a real implementation, this would use an LLM or other metric
+            return 0.7  # Mock score
+        return float(
+            _score_kernel(
+                np.ascontiguousarray(embedding, dtype=np.float32), self._reference
+            )
+        )
+
+    def evaluate_batch(self, thoughts: List[Thought]) -> np.ndarray:
+        """Evaluate a whole level of thoughts at once.
+
+        When every thought has an embedding, all cosine scores are computed in
+        one matrix-vector product; otherwise each thought is scored on its own.
+        """
+        if self._reference is not None:
+            embeddings = [self.embed_thought(thought) for thought in thoughts]
+            if thoughts and all(e is not None for e in embeddings):
+                matrix = np.asarray(embeddings, dtype=np.float32)
+                denom = np.linalg.norm(matrix, axis=1) * np.linalg.norm(self._reference)
+                dots = matrix @ self._reference
+                return np.divide(
+                    dots, denom, out=np.zeros_like(dots), where=denom != 0.0
+                )
+        return np.fromiter(
+            (self.evaluate_thought(thought) for thought in thoughts),
+            dtype=np.float64,
+            count=len(thoughts),
+        )
 
     def get_path_to_root(self, thought: Thought) -> List[str]:
         """Get the sequence of thoughts from root to current thought."""
-        path = []
+        path = deque()
         current = thought
         while current:
-            path.append(current.content)
+            path.appendleft(current.content)
             current = current.parent
-        return list(reversed(path))
+        return list(path)
 
     def solve(self, problem: str) -> List[str]:
         """
@@ -63,8 +136,7 @@ class TreeOfThoughts:
         self.root = Thought(problem, 1.0)
 
         # Priority queue for beam search
-        frontier = PriorityQueue()
-        frontier.put(self.root)
+        frontier: List[Thought] = [self.root]
 
         best_terminal_thought = None
         best_score = float("-inf")
@@ -73,29 +145,32 @@ class TreeOfThoughts:
         for depth in range(self.max_depth):
             level_thoughts = []
 
-            # Generate and evaluate thoughts for current level
-            while not frontier.empty() and len(level_thoughts) < self.beam_width:
-                current = frontier.get()
-
-                # Generate possible next thoughts
+            # Generate thoughts for current level
+            while frontier and len(level_thoughts) < self.beam_width:
+                current = heapq.heappop(frontier)
                 next_thoughts = self.generate_thoughts(current)
-
-                # Evaluate and store new thoughts
-                for thought in next_thoughts:
-                    thought.score = self.evaluate_thought(thought)
-                    current.children.append(thought)
-                    level_thoughts.append(thought)
-
-                    # Update best terminal thought if this is better
-                    if thought.score > best_score:
-                        best_terminal_thought = thought
-                        best_score = thought.score
-
-            # Add thoughts for next level exploration
-            for thought in sorted(level_thoughts, key=lambda x: x.score)[
-                : self.beam_width
-            ]:
-                frontier.put(thought)
+                current.children.extend(next_thoughts)
+                level_thoughts.extend(next_thoughts)
+
+            if not level_thoughts:
+                continue
+
+            # Evaluate the whole level in one batch
+            scores = self.evaluate_batch(level_thoughts)
+            for thought, score in zip(level_thoughts, scores.tolist()):
+                thought.score = score
+
+            # Update best terminal thought if this level has a better one
+            best_index = int(np.argmax(scores))
+            if scores[best_index] > best_score:
+                best_terminal_thought = level_thoughts[best_index]
+                best_score = float(scores[best_index])
+
+            # Add the top beam_width thoughts for next level exploration
+            k = min(self.beam_width, len(level_thoughts))
+            top = np.argpartition(-scores, k - 1)[:k]
+            for index in top.tolist():
+                heapq.heappush(frontier, level_thoughts[index])
 
         # Return the path of the best solution found
         return self.get_path_to_root(best_terminal_thought)
@@ -1,5 +1,37 @@
+from types import MappingProxyType
 from typing import Any, Dict
 
+# None of the step outputs depend on the input, so they are built once and
+# shared read-only across calls
+_SOCRATIC_QUESTIONS = (
+    "What specific details or background information are necessary to comprehend the issue at hand?",
+    "Are there any assumptions or constraints that need to be clarified?",
+    "What is the desired outcome of the solution?",
+)
+
+_INSTRUCTIONS = (
+    "Identify the core elements of the problem.",
+    "Outline a step-by-step approach to address the issue.",
+    "Ensure the solution aligns with the desired outcome.",
+)
+
+_REFLECTIONS = MappingProxyType(
+    {
+        "challenges": (
+            "What potential obstacles might arise during implementation?",
+            "Are there alternative approaches to consider?",
+        ),
+        "insights": "Prioritize the most effective and efficient approach to solve the problem.",
+    }
+)
+
+_SOLUTION = MappingProxyType(
+    {
+        "summary": "Use the insights gained to implement the solution step-by-step.",
+        "details": "Each step should be tested and validated to ensure correctness and feasibility.",
+    }
+)
+
 
 def somine_algorithm(context_input: str) -> Dict[str, Any]:
     """
@@ -15,48 +47,27 @@ def somine_algorithm(context_input: str) -> Dict[str, Any]:
 
     def socratic_inquiry(context: str) -> Dict[str, Any]:
         """Ask clarifying questions to gather a full understanding of the problem."""
-        questions = [
-            "What specific details or background information are necessary to comprehend the issue at hand?",
-            "Are there any assumptions or constraints that need to be clarified?",
-            "What is the desired outcome of the solution?",
-        ]
-        return {"context": context, "questions": questions}
+        return {"context": context, "questions": _SOCRATIC_QUESTIONS}
 
     def minimally_elicited_instruction(
         context_analysis: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Summarize the key steps required to resolve the issue."""
-        concise_instructions = [
-            "Identify the core elements of the problem.",
-            "Outline a step-by-step approach to address the issue.",
-            "Ensure the solution aligns with the desired outcome.",
-        ]
         return {
             "context_analysis": context_analysis,
-            "instructions": concise_instructions,
+            "instructions": _INSTRUCTIONS,
         }
 
     def reflection(context_instructions: Dict[str, Any]) -> Dict[str, Any]:
         """Reflect on the context and instructions to analyze insights or challenges."""
-        reflections = {
-            "challenges": [
-                "What potential obstacles might arise during implementation?",
-                "Are there alternative approaches to consider?",
-            ],
-            "insights": "Prioritize the most effective and efficient approach to solve the problem.",
-        }
         return {
             "context_instructions": context_instructions,
-            "reflections": reflections,
+            "reflections": _REFLECTIONS,
         }
 
     def final_answer(reflection_output: Dict[str, Any]) -> Dict[str, Any]:
         """Formulate a comprehensive solution that integrates all prior steps."""
-        solution = {
-            "summary": "Use the insights gained to implement the solution step-by-step.",
-            "details": "Each step should be tested and validated to ensure correctness and feasibility.",
-        }
-        return {"reflection_output": reflection_output, "solution": solution}
+        return {"reflection_output": reflection_output, "solution": _SOLUTION}
 
     # Algorithm Workflow
     inquiry_output = socratic_inquiry(context_input)
@@ -1,6 +1,37 @@
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import Any, Dict
 
+# The step outputs are constant, so they are built once and shared read-only
+_SOCRATIC_QUESTIONS = (
+    "What specific details or background information are necessary to comprehend the issue at hand?",
+    "Are there any assumptions or constraints that need to be clarified?",
+    "What is the desired outcome of the solution?",
+)
+
+_INSTRUCTIONS = (
+    "Identify the core elements of the problem.",
+    "Outline a step-by-step approach to address the issue.",
+    "Ensure the solution aligns with the desired outcome.",
+)
+
+_REFLECTIONS = MappingProxyType(
+    {
+        "challenges": (
+            "What potential obstacles might arise during implementation?",
+            "Are there alternative approaches to consider?",
+        ),
+        "insights": "Prioritize the most effective and efficient approach to solve the problem.",
+    }
+)
+
+_SOLUTION = MappingProxyType(
+    {
+        "summary": "Use the insights gained to implement the solution step-by-step.",
+        "details": "Each step should be tested and validated to ensure correctness and feasibility.",
+    }
+)
+
 
 class SoMinEStep(ABC):
     """Abstract base class for SoMinE algorithm steps."""
@@ -19,12 +50,7 @@ class SocraticInquiry(SoMinEStep):
 
     def execute(self) -> Dict[str, Any]:
         """Ask clarifying questions to fully understand the problem."""
-        questions = [
-            "What specific details or background information are necessary to comprehend the issue at hand?",
-            "Are there any assumptions or constraints that need to be clarified?",
-            "What is the desired outcome of the solution?",
-        ]
-        return {"context": self.context, "questions": questions}
+        return {"context": self.context, "questions": _SOCRATIC_QUESTIONS}
 
 
 class MinimallyElicitedInstruction(SoMinEStep):
@@ -35,14 +61,9 @@ class MinimallyElicitedInstruction(SoMinEStep):
 
     def execute(self) -> Dict[str, Any]:
         """Provide concise and precise instructions to resolve the problem."""
-        instructions = [
-            "Identify the core elements of the problem.",
-            "Outline a step-by-step approach to address the issue.",
-            "Ensure the solution aligns with the desired outcome.",
-        ]
         return {
             "context_analysis": self.context_analysis,
-            "instructions": instructions,
+            "instructions": _INSTRUCTIONS,
         }
 
 
@@ -54,16 +75,9 @@ class Reflection(SoMinEStep):
 
     def execute(self) -> Dict[str, Any]:
         """Reflect on insights, challenges, and factors influencing the solution."""
-        reflections = {
-            "challenges": [
-                "What potential obstacles might arise during implementation?",
-                "Are there alternative approaches to consider?",
-            ],
-            "insights": "Prioritize the most effective and efficient approach to solve the problem.",
-        }
         return {
             "context_instructions": self.context_instructions,
-            "reflections": reflections,
+            "reflections": _REFLECTIONS,
         }
 
 
@@ -75,13 +89,9 @@ class FinalAnswer(SoMinEStep):
 
     def execute(self) -> Dict[str, Any]:
         """Formulate a comprehensive solution based on all prior steps."""
-        solution = {
-            "summary": "Use the insights gained to implement the solution step-by-step.",
-            "details": "Each step should be tested and validated to ensure correctness and feasibility.",
-        }
         return {
             "reflection_output": self.reflection_output,
-            "solution": solution,
+            "solution": _SOLUTION,
         }
 
 
@@ -92,21 +102,19 @@ class SoMinEAlgorithm:
         self.context = context
 
     def execute(self) -> Dict[str, Any]:
-        """Execute the complete SoMinE algorithm workflow."""
-        # Step 1: Socratic Inquiry
-        inquiry = SocraticInquiry(self.context)
-        inquiry_output = inquiry.execute()
-
-        # Step 2: Minimally Elicited Instruction
-        instruction = MinimallyElicitedInstruction(inquiry_output)
-        instruction_output = instruction.execute()
+        """Execute the complete SoMinE algorithm workflow.
 
-        # Step 3: Reflection
-        reflection = Reflection(instruction_output)
-        reflection_output = reflection.execute()
-
-        # Step 4: Final Answer
-        final_answer = FinalAnswer(reflection_output)
-        solution = final_answer.execute()
-
-        return solution
+        The steps are fused into a single pass that fills one flat result dict
+        rather than wrapping each prior step's output in a new one.
+        """
+        return {
+            "context": self.context,
+            # Step 1: Socratic Inquiry
+            "questions": _SOCRATIC_QUESTIONS,
+            # Step 2: Minimally Elicited Instruction
+            "instructions": _INSTRUCTIONS,
+            # Step 3: Reflection
+            "reflections": _REFLECTIONS,
+            # Step 4: Final Answer
+            "solution": _SOLUTION,
+        }
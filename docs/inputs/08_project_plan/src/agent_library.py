@@ -17,6 +17,9 @@ class BaseAgent(ABC):
 
 
 class ProductivityAgent(BaseAgent):
+    _SYSTEM_PROMPT = """You are a productivity assistant focused on helping users optimize their task management and time allocation.
+Your goal is to analyze their current tasks and schedule to provide actionable suggestions."""
+
     def __init__(self):
         super().__init__(
             name="Productivity Assistant",
@@ -29,11 +32,13 @@ class ProductivityAgent(BaseAgent):
         return {"response": "Productivity agent response", "suggestions": []}
 
     def get_system_prompt(self) -> str:
-        return """You are a productivity assistant focused on helping users optimize their task management and time allocation.
-Your goal is to analyze their current tasks and schedule to provide actionable suggestions."""
+        return self._SYSTEM_PROMPT
 
 
 class SchedulingAgent(BaseAgent):
+    _SYSTEM_PROMPT = """You are a scheduling assistant focused on helping users manage their calendar effectively.
+Your goal is to find optimal meeting times and resolve scheduling conflicts."""
+
     def __init__(self):
         super().__init__(
             name="Scheduling Assistant",
@@ -46,13 +51,13 @@ class SchedulingAgent(BaseAgent):
         return {"response": "Scheduling agent response", "suggested_times": []}
 
     def get_system_prompt(self) -> str:
-        return """You are a scheduling assistant focused on helping users manage their calendar effectively.
-Your goal is to find optimal meeting times and resolve scheduling conflicts."""
+        return self._SYSTEM_PROMPT
 
 
 class AgentRegistry:
     def __init__(self):
         self._agents: Dict[str, BaseAgent] = {}
+        self._list_cache: Optional[List[Dict[str, str]]] = None
         self._register_default_agents()
 
     def _register_default_agents(self):
@@ -63,6 +68,7 @@ class AgentRegistry:
     def register_agent(self, agent_id: str, agent: BaseAgent):
         """Register a new agent."""
         self._agents[agent_id] = agent
+        self._list_cache = None
 
     def get_agent(self, agent_id: str) -> Optional[BaseAgent]:
         """Get an agent by ID."""
@@ -70,11 +76,13 @@ class AgentRegistry:
 
     def list_agents(self) -> List[Dict[str, str]]:
         """List all registered agents."""
-        return [
-            {
-                "id": agent_id,
-                "name": agent.name,
-                "description": agent.description,
-            }
-            for agent_id, agent in self._agents.items()
-        ]
+        if self._list_cache is None:
+            self._list_cache = [
+                {
+                    "id": agent_id,
+                    "name": agent.name,
+                    "description": agent.description,
+                }
+                for agent_id, agent in self._agents.items()
+            ]
+        return self._list_cache
@@ -1,15 +1,23 @@
+import json
 import os
 import pickle
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 
 
 class GoogleCalendarAPI:
     SCOPES = ["https://www.googleapis.com/auth/calendar"]
+    TOKEN_FILE = "token.json"
+    LEGACY_TOKEN_FILE = "token.pickle"
+    # Google caps a single batch HTTP request at 50 calls.
+    BATCH_LIMIT = 50
+    EVENT_FIELDS = "items(id,summary,description,start,end,updated)"
 
     def __init__(self):
         self.creds = None
@@ -18,9 +26,16 @@ class GoogleCalendarAPI:
 
     def _authenticate(self):
         """Handle Google Calendar authentication flow."""
-        if os.path.exists("token.pickle"):
-            with open("token.pickle", "rb") as token:
+        if os.path.exists(self.TOKEN_FILE):
+            with open(self.TOKEN_FILE) as token:
+                self.creds = Credentials.from_authorized_user_info(
+                    json.loads(token.read()), self.SCOPES
+                )
+        elif os.path.exists(self.LEGACY_TOKEN_FILE):
+            # One-time migration of the old pickled token to JSON
+            with open(self.LEGACY_TOKEN_FILE, "rb") as token:
                 self.creds = pickle.load(token)
+            self._save_credentials()
 
         if not self.creds or not self.creds.valid:
             if self.creds and self.creds.expired and self.creds.refresh_token:
@@ -31,10 +46,25 @@ class GoogleCalendarAPI:
                 )
                 self.creds = flow.run_local_server(port=0)
 
-            with open("token.pickle", "wb") as token:
-                pickle.dump(self.creds, token)
+            self._save_credentials()
+
+        # One long-lived authorized transport keeps the TLS connection alive
+        # across calls. No response cache: responses hold private calendar data.
+        http = AuthorizedHttp(self.creds, http=httplib2.Http())
+        # Use the discovery document bundled with google-api-python-client
+        # instead of fetching it over HTTPS on every process start.
+        self.service = build(
+            "calendar",
+            "v3",
+            http=http,
+            static_discovery=True,
+            cache_discovery=False,
+        )
 
-        self.service = build("calendar", "v3", credentials=self.creds)
+    def _save_credentials(self):
+        """Persist the current credentials as JSON."""
+        with open(self.TOKEN_FILE, "w") as token:
+            token.write(self.creds.to_json())
 
     def fetch_events(
         self, time_min=None, time_max=None, max_results=10
@@ -49,6 +79,7 @@ class GoogleCalendarAPI:
                 maxResults=max_results,
                 singleEvents=True,
                 orderBy="startTime",
+                fields=self.EVENT_FIELDS,
             )
             .execute()
         )
@@ -62,6 +93,42 @@ class GoogleCalendarAPI:
             .execute()
         )
 
+    def create_events(
+        self, events_data: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Create several events using batched requests.
+
+        Returns the created events in input order, with None for failed inserts.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(events_data)
+
+        def _collect(request_id: str, response: Dict[str, Any], exception) -> None:
+            if exception is not None:
+                print(f"Error creating event: {exception}")
+            else:
+                results[int(request_id)] = response
+
+        events = self.service.events()
+        self.batch_mutate(
+            [
+                (events.insert(calendarId="primary", body=event_data), _collect)
+                for event_data in events_data
+            ]
+        )
+        return results
+
+    def batch_mutate(self, ops: Sequence[Tuple[Any, Optional[Callable]]]) -> None:
+        """Execute (request, callback) pairs, BATCH_LIMIT requests per HTTP call.
+
+        Callbacks receive the op's index in ``ops`` as their request_id.
+        """
+        for offset in range(0, len(ops), self.BATCH_LIMIT):
+            batch = self.service.new_batch_http_request()
+            chunk = ops[offset : offset + self.BATCH_LIMIT]
+            for index, (request, callback) in enumerate(chunk, offset):
+                batch.add(request, callback=callback, request_id=str(index))
+            batch.execute()
+
     def update_event(self, event_id: str, event_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing event in Google Calendar."""
         return (
@@ -1,4 +1,6 @@
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from fastapi import Depends, FastAPI, HTTPException
@@ -22,12 +24,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services
-calendar_api = GoogleCalendarAPI()
-todoist_api = TodoistAPI()
-task_manager = TaskManager()
-rag_api = RAGAPI()
-agent_registry = AgentRegistry()
+
+# Services are created on first use so the app can bind its port without
+# waiting on OAuth and client setup.
+@lru_cache
+def get_calendar_api() -> GoogleCalendarAPI:
+    return GoogleCalendarAPI()
+
+
+@lru_cache
+def get_todoist_api() -> TodoistAPI:
+    return TodoistAPI()
+
+
+@lru_cache
+def get_task_manager() -> TaskManager:
+    return TaskManager()
+
+
+@lru_cache
+def get_rag_api() -> RAGAPI:
+    return RAGAPI()
+
+
+@lru_cache
+def get_agent_registry() -> AgentRegistry:
+    return AgentRegistry()
 
 
 class TaskCreate(BaseModel):
@@ -49,8 +71,16 @@ class AgentQuery(BaseModel):
     context: Optional[Dict[str, Any]] = None
 
 
+@app.get("/healthz")
+async def healthz() -> Dict[str, str]:
+    """Liveness probe that does not initialize any services."""
+    return {"status": "ok"}
+
+
 @app.get("/tasks")
-async def get_tasks() -> List[Dict[str, Any]]:
+async def get_tasks(
+    todoist_api: TodoistAPI = Depends(get_todoist_api),
+) -> List[Dict[str, Any]]:
     """Get all tasks from Todoist."""
     try:
         return todoist_api.get_tasks()
@@ -59,7 +89,11 @@ async def get_tasks() -> List[Dict[str, Any]]:
 
 
 @app.post("/tasks")
-async def create_task(task: TaskCreate) -> Dict[str, Any]:
+async def create_task(
+    task: TaskCreate,
+    todoist_api: TodoistAPI = Depends(get_todoist_api),
+    task_manager: TaskManager = Depends(get_task_manager),
+) -> Dict[str, Any]:
     """Create a new task in Todoist."""
     try:
         task_data = task.dict()
@@ -73,7 +107,9 @@ async def create_task(task: TaskCreate) -> Dict[str, Any]:
 
 
 @app.get("/events")
-async def get_events() -> List[Dict[str, Any]]:
+async def get_events(
+    calendar_api: GoogleCalendarAPI = Depends(get_calendar_api),
+) -> List[Dict[str, Any]]:
     """Get all events from Google Calendar."""
     try:
         return calendar_api.fetch_events()
@@ -82,7 +118,11 @@ async def get_events() -> List[Dict[str, Any]]:
 
 
 @app.post("/events")
-async def create_event(event: EventCreate) -> Dict[str, Any]:
+async def create_event(
+    event: EventCreate,
+    calendar_api: GoogleCalendarAPI = Depends(get_calendar_api),
+    task_manager: TaskManager = Depends(get_task_manager),
+) -> Dict[str, Any]:
     """Create a new event in Google Calendar."""
     try:
         event_data = event.dict()
@@ -95,23 +135,33 @@ async def create_event(event: EventCreate) -> Dict[str, Any]:
 
 
 @app.post("/sync")
-async def sync_all() -> Dict[str, str]:
+async def sync_all(
+    task_manager: TaskManager = Depends(get_task_manager),
+) -> Dict[str, str]:
     """Perform a full sync between Todoist and Google Calendar."""
     try:
-        task_manager.sync_all()
+        await task_manager.sync_all()
         return {"status": "success", "message": "Sync completed"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/agents")
-async def list_agents() -> List[Dict[str, str]]:
+async def list_agents(
+    agent_registry: AgentRegistry = Depends(get_agent_registry),
+) -> List[Dict[str, str]]:
     """List all available agents."""
     return agent_registry.list_agents()
 
 
 @app.post("/agents/query")
-async def query_agent(query: AgentQuery) -> Dict[str, Any]:
+async def query_agent(
+    query: AgentQuery,
+    agent_registry: AgentRegistry = Depends(get_agent_registry),
+    todoist_api: TodoistAPI = Depends(get_todoist_api),
+    calendar_api: GoogleCalendarAPI = Depends(get_calendar_api),
+    rag_api: RAGAPI = Depends(get_rag_api),
+) -> Dict[str, Any]:
     """Query a specific agent."""
     try:
         agent = agent_registry.get_agent(query.agent_id)
@@ -120,8 +170,10 @@ async def query_agent(query: AgentQuery) -> Dict[str, Any]:
 
         # Get current context if not provided
         if not query.context:
-            tasks = todoist_api.get_tasks()
-            events = calendar_api.fetch_events()
+            tasks, events = await asyncio.gather(
+                asyncio.to_thread(todoist_api.get_tasks),
+                asyncio.to_thread(calendar_api.fetch_events),
+            )
             context = rag_api.fetch_context(tasks, events)
         else:
             context = query.context
@@ -1,60 +1,266 @@
+import asyncio
+import hashlib
 import os
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+import numpy as np
 import openai
 
 
+def _cache_key(prompt: str, context: str) -> str:
+    """Exact-match cache key for a (prompt, context) pair."""
+    return hashlib.blake2b(f"{prompt}\0{context}".encode(), digest_size=16).hexdigest()
+
+
+def _context_id(context: str) -> int:
+    """64-bit hash identifying a context in the semantic cache."""
+    digest = hashlib.blake2b(context.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+@lru_cache(maxsize=None)
+def _shared_client(api_key: Optional[str]) -> openai.AsyncOpenAI:
+    """Process-wide AsyncOpenAI client (and connection pool) per API key."""
+    return openai.AsyncOpenAI(api_key=api_key)
+
+
+class _SemanticCache:
+    """Completions keyed by unit-normalized prompt embeddings.
+
+    Each entry also records the hash of the context it was answered against,
+    and only entries with the same context can match. A lookup is a single
+    matrix-vector product over the stored embeddings; once full, the least
+    recently used entry is overwritten.
+    """
+
+    def __init__(self, max_size: int, threshold: float):
+        self.max_size = max_size
+        self.threshold = threshold
+        self._bank: Optional[np.ndarray] = None
+        self._last_used = np.zeros(0, dtype=np.int64)
+        self._context_ids = np.zeros(0, dtype=np.int64)
+        self._responses: List[str] = []
+        self._clock = 0
+
+    def has_context(self, context_id: int) -> bool:
+        size = len(self._responses)
+        return bool(size) and bool(np.any(self._context_ids[:size] == context_id))
+
+    def lookup(self, embedding: np.ndarray, context_id: int) -> Optional[str]:
+        size = len(self._responses)
+        if not size:
+            return None
+        sims = np.where(
+            self._context_ids[:size] == context_id, self._bank[:size] @ embedding, -1.0
+        )
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            return None
+        self._clock += 1
+        self._last_used[best] = self._clock
+        return self._responses[best]
+
+    def store(self, embedding: np.ndarray, context_id: int, response: str) -> None:
+        self._clock += 1
+        size = len(self._responses)
+        if size == self.max_size:
+            slot = int(np.argmin(self._last_used))
+            self._responses[slot] = response
+        else:
+            if self._bank is None or size == len(self._bank):
+                self._grow(embedding.shape[0])
+            slot = size
+            self._responses.append(response)
+        self._bank[slot] = embedding
+        self._context_ids[slot] = context_id
+        self._last_used[slot] = self._clock
+
+    def _grow(self, dim: int) -> None:
+        capacity = min(self.max_size, max(1024, 2 * len(self._responses)))
+        bank = np.zeros((capacity, dim), dtype=np.float32)
+        last_used = np.zeros(capacity, dtype=np.int64)
+        context_ids = np.zeros(capacity, dtype=np.int64)
+        if self._bank is not None:
+            bank[: len(self._bank)] = self._bank
+            last_used[: len(self._last_used)] = self._last_used
+            context_ids[: len(self._context_ids)] = self._context_ids
+        self._bank = bank
+        self._last_used = last_used
+        self._context_ids = context_ids
+
+
 class RAGAPI:
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    EXACT_CACHE_SIZE = 10_000
+    SEMANTIC_CACHE_SIZE = 50_000
+    SEMANTIC_THRESHOLD = 0.95
+
     def __init__(self):
         self.api_key = os.getenv("OPENAI_API_KEY")
-        openai.api_key = self.api_key
+        # Instances share one client so requests reuse its connection pool
+        self._client = _shared_client(self.api_key)
+        self._exact_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._semantic_cache = _SemanticCache(
+            self.SEMANTIC_CACHE_SIZE, self.SEMANTIC_THRESHOLD
+        )
 
     def fetch_context(
         self, tasks: List[Dict[str, Any]], events: List[Dict[str, Any]]
     ) -> str:
         """Gather context from tasks and events."""
         context = []
+        append = context.append
 
         # Add task context
         for task in tasks:
-            context.append(f"Task: {task['content']}")
-            if task.get("description"):
-                context.append(f"Description: {task['description']}")
-            if task.get("due"):
-                context.append(f"Due: {task['due']}")
+            append(f"Task: {task['content']}")
+            description = task.get("description")
+            if description:
+                append(f"Description: {description}")
+            due = task.get("due")
+            if due:
+                append(f"Due: {due}")
 
         # Add event context
         for event in events:
-            context.append(f"Event: {event['summary']}")
-            if event.get("description"):
-                context.append(f"Description: {event['description']}")
-            if event.get("start"):
-                context.append(f"Start: {event['start']['dateTime']}")
+            append(f"Event: {event['summary']}")
+            description = event.get("description")
+            if description:
+                append(f"Description: {description}")
+            start = event.get("start")
+            if start:
+                append(f"Start: {start['dateTime']}")
 
         return "\n".join(context)
 
     async def get_completion(self, prompt: str, context: str) -> str:
-        """Get completion from the RAG API."""
+        """Get completion from the RAG API.
+
+        Repeated (prompt, context) pairs are answered from an exact-match
+        cache. A rephrased prompt is answered from the semantic cache, but only
+        if an earlier prompt was asked against the identical context. Only the
+        prompt is embedded; when no lookup is possible, the embedding for the
+        new entry is fetched alongside the completion rather than before it.
+        """
+        key = _cache_key(prompt, context)
+        cached = self._exact_cache.get(key)
+        if cached is not None:
+            self._exact_cache.move_to_end(key)
+            return cached
+
+        context_id = _context_id(context)
+        embedding = None
+        if self._semantic_cache.has_context(context_id):
+            embedding = await self._embed(prompt)
+            if embedding is not None:
+                cached = self._semantic_cache.lookup(embedding, context_id)
+                if cached is not None:
+                    self._remember(key, cached)
+                    return cached
+
+        embed_task = (
+            asyncio.ensure_future(self._embed(prompt)) if embedding is None else None
+        )
         try:
-            response = await openai.ChatCompletion.acreate(
-                model="gpt-4o",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant with access to the user's tasks and calendar events.",
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Context:\n{context}\n\nPrompt: {prompt}",
-                    },
-                ],
+            completion = "".join(
+                [chunk async for chunk in self._stream_model(prompt, context)]
             )
-            return response.choices[0].message.content
         except Exception as e:
             print(f"Error getting completion: {e}")
+            if embed_task is not None:
+                embed_task.cancel()
             return ""
 
+        self._remember(key, completion)
+        if embed_task is not None:
+            embedding = await embed_task
+        if embedding is not None:
+            self._semantic_cache.store(embedding, context_id, completion)
+        return completion
+
+    async def get_completion_stream(
+        self, prompt: str, context: str
+    ) -> AsyncIterator[str]:
+        """Stream a completion from the RAG API as it is generated.
+
+        Exact repeats are served from the cache in one chunk. The semantic
+        cache is skipped since its embedding round-trip would delay the first
+        token.
+        """
+        key = _cache_key(prompt, context)
+        cached = self._exact_cache.get(key)
+        if cached is not None:
+            self._exact_cache.move_to_end(key)
+            yield cached
+            return
+
+        parts = []
+        try:
+            async for chunk in self._stream_model(prompt, context):
+                parts.append(chunk)
+                yield chunk
+        except Exception as e:
+            print(f"Error getting completion: {e}")
+            return
+        self._remember(key, "".join(parts))
+
+    async def _stream_model(self, prompt: str, context: str) -> AsyncIterator[str]:
+        """Yield the model's completion text chunk by chunk."""
+        stream = await self._client.chat.completions.create(
+            model="gpt-4o",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are a helpful assistant with access to the user's tasks and calendar events.",
+                },
+                {
+                    "role": "user",
+                    "content": f"Context:\n{context}\n\nPrompt: {prompt}",
+                },
+            ],
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Unit-normalized embedding of ``text``, or None if unavailable."""
+        try:
+            response = await self._client.embeddings.create(
+                model=self.EMBEDDING_MODEL, input=text
+            )
+        except Exception as e:
+            print(f"Error getting embedding: {e}")
+            return None
+        embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm else None
+
+    def _remember(self, key: str, completion: str) -> None:
+        """Store a completion in the exact-match cache, evicting LRU entries."""
+        self._exact_cache[key] = completion
+        self._exact_cache.move_to_end(key)
+        if len(self._exact_cache) > self.EXACT_CACHE_SIZE:
+            self._exact_cache.popitem(last=False)
+
+    async def get_completions(
+        self, prompts: List[str], context: str, max_concurrency: int = 20
+    ) -> List[str]:
+        """Get completions for several prompts concurrently, in prompt order."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(prompt: str) -> str:
+            async with semaphore:
+                return await self.get_completion(prompt, context)
+
+        return await asyncio.gather(*(_one(prompt) for prompt in prompts))
+
     def process_agent_interaction(
         self, agent_type: str, prompt: str, context: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -1,14 +1,29 @@
+import asyncio
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 from .calendar_api import GoogleCalendarAPI
 from .todoist_api import TodoistAPI
 
 
+@lru_cache(maxsize=65536)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, reusing results for repeated strings."""
+    return datetime.fromisoformat(timestamp)
+
+
 class TaskManager:
+    # Upper bound on Todoist requests in flight during a full sync
+    SYNC_CONCURRENCY = 50
+
     def __init__(self):
         self.calendar_api = GoogleCalendarAPI()
         self.todoist_api = TodoistAPI()
+        # Links between Todoist task ids and calendar event ids, kept across
+        # syncs so already-linked items are not pushed again
+        self.task_event_map: Dict[str, str] = {}
+        self.event_task_map: Dict[str, str] = {}
 
     def sync_task_to_calendar(self, task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Sync a Todoist task to Google Calendar."""
@@ -19,6 +34,17 @@ class TaskManager:
             print(f"Error syncing task to calendar: {e}")
             return None
 
+    def sync_tasks_to_calendar(
+        self, tasks: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Sync several Todoist tasks to Google Calendar in batched requests.
+
+        Returns the created events in task order, with None for failures.
+        """
+        return self.calendar_api.create_events(
+            [self._convert_task_to_event(task) for task in tasks]
+        )
+
     def sync_event_to_todoist(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Sync a Google Calendar event to Todoist."""
         task_data = self._convert_event_to_task(event)
@@ -55,29 +81,52 @@ class TaskManager:
         self, task: Dict[str, Any], event: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Resolve conflicts between Todoist task and Google Calendar event."""
-        task_updated = datetime.fromisoformat(task.get("date_modified", ""))
-        event_updated = datetime.fromisoformat(event.get("updated", ""))
+        task_updated = _parse_iso(task.get("date_modified", ""))
+        event_updated = _parse_iso(event.get("updated", ""))
 
         return task if task_updated > event_updated else event
 
-    def sync_all(self):
+    async def sync_all(self):
         """Perform a full sync between Todoist and Google Calendar."""
-        tasks = self.todoist_api.get_tasks()
-        events = self.calendar_api.fetch_events()
-
-        # Create a mapping of linked items
-        task_event_map = {}
+        tasks, events = await asyncio.gather(
+            asyncio.to_thread(self.todoist_api.get_tasks),
+            asyncio.to_thread(self.calendar_api.fetch_events),
+        )
 
-        # Sync new tasks to calendar
+        # Fold links recorded on the items themselves into the index
         for task in tasks:
-            if not task.get("calendar_event_id"):
-                event = self.sync_task_to_calendar(task)
-                if event:
-                    task_event_map[task["id"]] = event["id"]
-
-        # Sync new events to Todoist
+            if task.get("calendar_event_id"):
+                self._link(task["id"], task["calendar_event_id"])
         for event in events:
-            if not event.get("todoist_task_id"):
-                task = self.sync_event_to_todoist(event)
-                if task:
-                    task_event_map[event["id"]] = task["id"]
+            if event.get("todoist_task_id"):
+                self._link(event["todoist_task_id"], event["id"])
+
+        task_event_map = self.task_event_map
+        event_task_map = self.event_task_map
+        new_tasks = [task for task in tasks if task["id"] not in task_event_map]
+        new_events = [event for event in events if event["id"] not in event_task_map]
+        semaphore = asyncio.Semaphore(self.SYNC_CONCURRENCY)
+
+        async def _sync_event(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self.sync_event_to_todoist, event)
+
+        # New tasks go to the calendar in batched requests while new events
+        # are pushed to Todoist concurrently
+        created_events, created_tasks = await asyncio.gather(
+            asyncio.to_thread(self.sync_tasks_to_calendar, new_tasks),
+            asyncio.gather(*(_sync_event(event) for event in new_events)),
+        )
+
+        for task, event in zip(new_tasks, created_events):
+            if event:
+                self._link(task["id"], event["id"])
+
+        for event, task in zip(new_events, created_tasks):
+            if task:
+                self._link(task["id"], event["id"])
+
+    def _link(self, task_id: str, event_id: str) -> None:
+        """Record that a Todoist task and a calendar event mirror each other."""
+        self.task_event_map[task_id] = event_id
+        self.event_task_map[event_id] = task_id
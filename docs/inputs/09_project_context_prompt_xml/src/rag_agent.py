@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Any, Dict, List
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     task_history: List[Dict[str, Any]]
     calendar_events: List[Dict[str, Any]]
@@ -1,9 +1,12 @@
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 
+SyncStatus = Literal["pending", "synced", "error"]
 
-@dataclass
+
+@dataclass(slots=True)
 class SyncItem:
     id: str
     title: str
@@ -11,14 +14,28 @@ class SyncItem:
     due_date: Optional[datetime]
     source: str  # 'todoist' or 'calendar'
     last_modified: datetime
-    sync_status: str  # 'pending', 'synced', 'error'
+    sync_status: SyncStatus
 
 
 class TodoistCalendarSync:
     def __init__(self, todoist_api_key: str, google_calendar_credentials: Dict):
         self.todoist_api_key = todoist_api_key
         self.google_calendar_credentials = google_calendar_credentials
+        # Add items via add_item and change statuses via set_status so the
+        # per-status counts stay in step with sync_items
         self.sync_items: List[SyncItem] = []
+        self._status_counts: Counter = Counter(pending=0, synced=0, error=0)
+
+    def add_item(self, item: SyncItem) -> None:
+        """Track a new item for syncing."""
+        self.sync_items.append(item)
+        self._status_counts[item.sync_status] += 1
+
+    def set_status(self, item: SyncItem, status: SyncStatus) -> None:
+        """Update the sync status of a tracked item."""
+        self._status_counts[item.sync_status] -= 1
+        item.sync_status = status
+        self._status_counts[status] += 1
 
     def sync_todoist_to_calendar(self, task_id: str) -> bool:
         """Sync a Todoist task to Google Calendar."""
@@ -39,7 +56,7 @@ class TodoistCalendarSync:
     def get_sync_status(self) -> Dict[str, int]:
         """Get current sync statistics."""
         return {
-            "pending": len([i for i in self.sync_items if i.sync_status == "pending"]),
-            "synced": len([i for i in self.sync_items if i.sync_status == "synced"]),
-            "error": len([i for i in self.sync_items if i.sync_status == "error"]),
+            "pending": self._status_counts["pending"],
+            "synced": self._status_counts["synced"],
+            "error": self._status_counts["error"],
         }
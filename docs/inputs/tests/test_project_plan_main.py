@@ -0,0 +1,22 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient  # noqa: E402
+
+# The method packages have numeric names, so they are imported by string
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+main = importlib.import_module("08_project_plan.src.main")
+
+
+def test_healthz_does_not_initialize_services():
+    main.get_calendar_api.cache_clear()
+
+    response = TestClient(main.app).get("/healthz")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    assert main.get_calendar_api.cache_info().currsize == 0
@@ -0,0 +1,22 @@
+import importlib
+import sys
+from pathlib import Path
+
+# The method packages have numeric names, so they are imported by string
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+som = importlib.import_module("05_holistic_list_of_agent_methods.society_of_mind")
+
+
+def test_match_specialties_ignores_punctuation():
+    assert som._match_specialties("Can you plan?") == {som.Specialty.PLANNING}
+    assert som._match_specialties("Explain, then calculate.") == {
+        som.Specialty.LANGUAGE,
+        som.Specialty.LOGIC,
+        som.Specialty.MATH,
+    }
+
+
+def test_can_handle_punctuated_task():
+    agent = som.SubAgent("planner", som.Specialty.PLANNING, lambda task: task)
+    assert agent.can_handle("Please organize!")
+    assert not agent.can_handle("Please explain.")
@@ -2,42 +2,84 @@
 Command-line interface for Aerith ingestion.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Dict, List, Optional
+
 import click
-from loguru import logger
 
-from aerith_ingestion.config import AppConfig, load_config
-from aerith_ingestion.config.logging import setup_logging
+if TYPE_CHECKING:
+    from aerith_ingestion.config import AppConfig
 
 
 class CommandContext:
-    """Context object for CLI commands with shared dependencies."""
+    """Context object for CLI commands with shared dependencies.
+
+    Configuration and logging are set up on first access so that commands
+    which never need them (and ``--help``) skip that work.
+    """
+
+    def __init__(self):
+        self._config: Optional["AppConfig"] = None
+
+    @property
+    def config(self) -> "AppConfig":
+        if self._config is None:
+            from aerith_ingestion.config import load_config
+            from aerith_ingestion.config.logging import setup_logging
 
-    def __init__(self, config: AppConfig):
-        self.config = config
+            self._config = load_config()
+            setup_logging(self._config.logging)
+        return self._config
 
 
 pass_context = click.make_pass_decorator(CommandContext)
 
 
-@click.group()
-@click.pass_context
-def cli(ctx):
-    """Aerith ingestion CLI."""
-    # Initialize logging and config
-    config = load_config()
-    setup_logging(config.logging)
-    ctx.obj = CommandContext(config)
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand only when it is resolved."""
 
+    def __init__(self, *args, lazy_subcommands: Dict[str, str], **kwargs):
+        super().__init__(*args, **kwargs)
+        # Command name -> "module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands
 
-from aerith_ingestion.commands.calendar import calendar  # noqa
-from aerith_ingestion.commands.crawl import crawl  # noqa
-from aerith_ingestion.commands.webhook import webhook  # noqa
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
 
-# Register commands
-cli.add_command(sync)
-cli.add_command(crawl)
-cli.add_command(webhook)
-cli.add_command(calendar)
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr_name = self.lazy_subcommands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), attr_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        # Lazy commands are listed by name only so --help imports none of them
+        rows = []
+        for name in self.list_commands(ctx):
+            cmd = super().get_command(ctx, name)
+            if cmd is None:
+                rows.append((name, ""))
+            elif not cmd.hidden:
+                rows.append((name, cmd.get_short_help_str()))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "calendar": "aerith_ingestion.commands.calendar:calendar",
+        "crawl": "aerith_ingestion.commands.crawl:crawl",
+        "webhook": "aerith_ingestion.commands.webhook:webhook",
+    },
+)
+@click.pass_context
+def cli(ctx):
+    """Aerith ingestion CLI."""
+    ctx.obj = CommandContext()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,73 @@
 """Repository for managing calendar event persistence."""
 
+import json
+import sqlite3
+import zlib
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
+from dateutil.parser import isoparse, parse
 from loguru import logger
 
 from aerith_ingestion.persistence.database import Database
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+
+    def _dumps(value) -> str:
+        """Serialize to compact JSON text with orjson."""
+        return orjson.dumps(value).decode()
+
+else:
+    _dumps = json.dumps
+
+
+def _pack(value: dict) -> bytes:
+    """Serialize a history payload as zlib-compressed JSON."""
+    return zlib.compress(_dumps(value).encode())
+
+
+def _unpack(value) -> Optional[dict]:
+    """Load a history payload; older rows hold plain JSON text."""
+    if not value:
+        return None
+    if isinstance(value, bytes):
+        value = zlib.decompress(value)
+    return json.loads(value)
+
+
+def _parse_gcal_dt(value: str) -> datetime:
+    """Parse a Google Calendar timestamp or all-day date.
+
+    Google emits RFC 3339 strings (and YYYY-MM-DD for all-day events), which
+    datetime.fromisoformat handles directly on Python 3.11+, including a
+    trailing ``Z``. dateutil is only used for anything it rejects.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            return isoparse(value)
+        except ValueError:
+            return parse(value)
+
+
+# Event times are stored as integer microseconds since the Unix epoch (UTC)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Convert a datetime to epoch microseconds; naive values are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
 
 @dataclass
 class CalendarEvent:
@@ -39,10 +99,6 @@ class CalendarEvent:
         Returns:
             CalendarEvent instance
         """
-        import json
-
-        from dateutil.parser import parse
-
         # Parse start and end times
         start = event.get("start", {})
         end = event.get("end", {})
@@ -52,22 +108,22 @@ class CalendarEvent:
         end_time = end.get("dateTime") or end.get("date")
 
         # Convert to datetime objects
-        start_time = parse(start_time)
-        end_time = parse(end_time)
+        start_time = _parse_gcal_dt(start_time)
+        end_time = _parse_gcal_dt(end_time)
 
         # Parse timestamps
-        created_at = parse(event["created"])
-        updated_at = parse(event["updated"])
+        created_at = _parse_gcal_dt(event["created"])
+        updated_at = _parse_gcal_dt(event["updated"])
 
         # Handle attendees
         attendees = event.get("attendees")
         if attendees:
-            attendees = json.dumps(attendees)
+            attendees = _dumps(attendees)
 
         # Handle conference data
         conference_data = event.get("conferenceData")
         if conference_data:
-            conference_data = json.dumps(conference_data)
+            conference_data = _dumps(conference_data)
 
         return cls(
             event_id=event["id"],
@@ -82,13 +138,55 @@ class CalendarEvent:
             status=event.get("status", "confirmed"),
             is_recurring=bool(event.get("recurrence")),
             recurrence=(
-                json.dumps(event["recurrence"]) if event.get("recurrence") else None
+                _dumps(event["recurrence"]) if event.get("recurrence") else None
             ),
             attendees=attendees,
             conference_data=conference_data,
         )
 
 
+def _row_to_event(
+    row: Tuple, _epoch=_EPOCH, _us=timedelta, _cls=CalendarEvent
+) -> CalendarEvent:
+    """Build a CalendarEvent from a row in calendar_events column order.
+
+    Times come back as UTC datetimes. The helpers and class are bound as
+    defaults so the per-row cost is local lookups only.
+    """
+    (
+        event_id,
+        calendar_id,
+        summary,
+        description,
+        start_time,
+        end_time,
+        location,
+        created_at,
+        updated_at,
+        status,
+        is_recurring,
+        recurrence,
+        attendees,
+        conference_data,
+    ) = row
+    return _cls(
+        event_id,
+        calendar_id,
+        summary,
+        description,
+        _epoch + _us(microseconds=start_time),
+        _epoch + _us(microseconds=end_time),
+        location,
+        _epoch + _us(microseconds=created_at),
+        _epoch + _us(microseconds=updated_at),
+        status,
+        bool(is_recurring),
+        recurrence,
+        attendees,
+        conference_data,
+    )
+
+
 class SQLiteCalendarEventRepository:
     """SQLite repository for calendar events."""
 
@@ -111,11 +209,11 @@ class SQLiteCalendarEventRepository:
                 calendar_id TEXT,
                 summary TEXT NOT NULL,
                 description TEXT,
-                start_time TIMESTAMP NOT NULL,
-                end_time TIMESTAMP NOT NULL,
+                start_time INTEGER NOT NULL,  -- epoch microseconds, UTC
+                end_time INTEGER NOT NULL,  -- epoch microseconds, UTC
                 location TEXT,
-                created_at TIMESTAMP NOT NULL,
-                updated_at TIMESTAMP NOT NULL,
+                created_at INTEGER NOT NULL,  -- epoch microseconds, UTC
+                updated_at INTEGER NOT NULL,  -- epoch microseconds, UTC
                 status TEXT NOT NULL,
                 is_recurring BOOLEAN NOT NULL DEFAULT 0,
                 recurrence TEXT,
@@ -136,85 +234,202 @@ class SQLiteCalendarEventRepository:
                 calendar_id TEXT NOT NULL,
                 change_type TEXT NOT NULL,  -- 'created', 'updated', 'deleted'
                 timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                old_data TEXT,  -- JSON of old event data if update/delete
-                new_data TEXT,  -- JSON of new event data if create/update
-                FOREIGN KEY (event_id, calendar_id) 
+                old_data BLOB,  -- compressed JSON of old event data if update/delete
+                new_data BLOB,  -- compressed JSON of new event data if create/update
+                FOREIGN KEY (event_id, calendar_id)
                     REFERENCES calendar_events (event_id, calendar_id)
             )
         """
         )
 
-    def save(self, event: CalendarEvent) -> None:
+        self._migrate_text_times()
+
+        # Indexes backing the per-calendar ORDER BY/LIMIT queries below
+        for statement in (
+            """
+            CREATE INDEX IF NOT EXISTS idx_events_cal_start
+            ON calendar_events (calendar_id, start_time)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_events_cal_updated
+            ON calendar_events (calendar_id, updated_at DESC)
+            WHERE is_deleted = 0
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_events_cal_end
+            ON calendar_events (calendar_id, end_time)
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_history_event
+            ON calendar_event_history (event_id, calendar_id, timestamp DESC)
+            """,
+        ):
+            self.db.execute(statement)
+
+    def _migrate_text_times(self) -> None:
+        """Convert event times left as ISO text by older versions to integers."""
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                """
+                SELECT event_id, calendar_id, start_time, end_time, created_at,
+                       updated_at
+                FROM calendar_events
+                WHERE typeof(start_time) = 'text' OR typeof(end_time) = 'text'
+                   OR typeof(created_at) = 'text' OR typeof(updated_at) = 'text'
+                """
+            ).fetchall()
+            if not rows:
+                return
+            logger.info(f"Converting times of {len(rows)} calendar events")
+            updates = []
+            for event_id, calendar_id, *times in rows:
+                times = [
+                    (
+                        _to_epoch_us(datetime.fromisoformat(value))
+                        if isinstance(value, str)
+                        else value
+                    )
+                    for value in times
+                ]
+                updates.append((*times, event_id, calendar_id))
+            conn.executemany(
+                """
+                UPDATE calendar_events
+                SET start_time = ?, end_time = ?, created_at = ?, updated_at = ?
+                WHERE event_id = ? AND calendar_id = ?
+                """,
+                updates,
+            )
+
+    def save(self, event: CalendarEvent, record_history: bool = True) -> None:
         """Save a calendar event.
 
         Args:
             event: Event to save
+            record_history: Whether to record the change in the history table.
+                Backfills can pass False to skip looking up the existing row.
         """
-        import json
-
         logger.debug(f"Saving calendar event {event.event_id}")
+        self._write([event], record_history)
 
-        # Check if event exists and get current data
-        existing = self.get_event(event.event_id, event.calendar_id)
-        change_type = "created" if not existing else "updated"
+    def save_all(
+        self, events: List[CalendarEvent], record_history: bool = True
+    ) -> None:
+        """Save a batch of calendar events in a single transaction.
 
-        # Prepare event data for history
-        new_data = {
-            "summary": event.summary,
-            "description": event.description,
-            "start_time": event.start_time.isoformat(),
-            "end_time": event.end_time.isoformat(),
-            "location": event.location,
-            "status": event.status,
-            "is_recurring": event.is_recurring,
-            "recurrence": event.recurrence,
-            "attendees": event.attendees,
-            "conference_data": event.conference_data,
-        }
+        Equivalent to calling save() for each event in order, but existing
+        rows are fetched in bulk and all inserts are issued with executemany.
 
-        # Save the event
-        self.db.execute(
-            """
-            INSERT OR REPLACE INTO calendar_events (
-                event_id, calendar_id, summary, description, start_time, end_time,
-                location, created_at, updated_at, status, is_recurring,
-                recurrence, attendees, conference_data, is_deleted
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
-            """,
-            (
-                event.event_id,
-                event.calendar_id,
-                event.summary,
-                event.description,
-                event.start_time,
-                event.end_time,
-                event.location,
-                event.created_at,
-                event.updated_at,
-                event.status,
-                event.is_recurring,
-                event.recurrence,
-                event.attendees,
-                event.conference_data,
-            ),
-        )
+        Args:
+            events: Events to save
+            record_history: Whether to record the changes in the history table
+        """
+        if not events:
+            return
 
-        # Record the change in history
-        self.db.execute(
-            """
-            INSERT INTO calendar_event_history (
-                event_id, calendar_id, change_type, 
-                old_data, new_data
-            ) VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                event.event_id,
-                event.calendar_id,
-                change_type,
-                json.dumps(self._event_to_dict(existing)) if existing else None,
-                json.dumps(new_data),
-            ),
-        )
+        logger.debug(f"Saving {len(events)} calendar events")
+        self._write(events, record_history)
+
+    def _write(self, events: List[CalendarEvent], record_history: bool) -> None:
+        """Upsert events, and optionally their history, in one transaction."""
+        with self.db.transaction() as conn:
+            existing = (
+                self._fetch_existing(
+                    conn, {(e.event_id, e.calendar_id) for e in events}
+                )
+                if record_history
+                else {}
+            )
+
+            event_rows = []
+            history_rows = []
+            # Each event's history payload, kept for later duplicates in the batch
+            snapshots: Dict[Tuple[str, str], bytes] = {}
+            for event in events:
+                key = (event.event_id, event.calendar_id)
+                previous = existing.get(key)
+                event_rows.append(
+                    (
+                        event.event_id,
+                        event.calendar_id,
+                        event.summary,
+                        event.description,
+                        _to_epoch_us(event.start_time),
+                        _to_epoch_us(event.end_time),
+                        event.location,
+                        _to_epoch_us(event.created_at),
+                        _to_epoch_us(event.updated_at),
+                        event.status,
+                        event.is_recurring,
+                        event.recurrence,
+                        event.attendees,
+                        event.conference_data,
+                    )
+                )
+                if not record_history:
+                    continue
+                old_data = snapshots.get(key)
+                if old_data is None and previous is not None:
+                    old_data = _pack(self._event_to_dict(previous))
+                new_data = _pack(self._event_to_dict(event))
+                history_rows.append(
+                    (
+                        event.event_id,
+                        event.calendar_id,
+                        "updated" if old_data else "created",
+                        old_data,
+                        new_data,
+                    )
+                )
+                snapshots[key] = new_data
+
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO calendar_events (
+                    event_id, calendar_id, summary, description, start_time,
+                    end_time, location, created_at, updated_at, status,
+                    is_recurring, recurrence, attendees, conference_data,
+                    is_deleted
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+                """,
+                event_rows,
+            )
+            if history_rows:
+                conn.executemany(
+                    """
+                INSERT INTO calendar_event_history (
+                    event_id, calendar_id, change_type, old_data, new_data
+                ) VALUES (?, ?, ?, ?, ?)
+                """,
+                    history_rows,
+                )
+
+    # Keeps each lookup well under SQLite's bound-parameter limit
+    _FETCH_CHUNK = 400
+
+    def _fetch_existing(
+        self, conn: sqlite3.Connection, keys: Set[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], CalendarEvent]:
+        """Fetch live events for the given (event_id, calendar_id) keys."""
+        existing: Dict[Tuple[str, str], CalendarEvent] = {}
+        key_list = list(keys)
+        for start in range(0, len(key_list), self._FETCH_CHUNK):
+            chunk = key_list[start : start + self._FETCH_CHUNK]
+            placeholders = ", ".join(["(?, ?)"] * len(chunk))
+            rows = conn.execute(
+                f"""
+                SELECT event_id, calendar_id, summary, description, start_time,
+                       end_time, location, created_at, updated_at, status,
+                       is_recurring, recurrence, attendees, conference_data
+                FROM calendar_events
+                WHERE (event_id, calendar_id) IN (VALUES {placeholders})
+                  AND is_deleted = 0
+                """,
+                [value for key in chunk for value in key],
+            ).fetchall()
+            for row in rows:
+                existing[(row[0], row[1])] = _row_to_event(row)
+        return existing
 
     def delete(self, event_id: str, calendar_id: str) -> None:
         """Delete a calendar event.
@@ -223,8 +438,6 @@ class SQLiteCalendarEventRepository:
             event_id: ID of event to delete
             calendar_id: ID of calendar containing the event
         """
-        import json
-
         logger.debug(f"Deleting calendar event {event_id}")
 
         # Get current data before deletion
@@ -237,10 +450,10 @@ class SQLiteCalendarEventRepository:
         self.db.execute(
             """
             UPDATE calendar_events 
-            SET is_deleted = 1, updated_at = datetime('now')
+            SET is_deleted = 1, updated_at = ?
             WHERE event_id = ? AND calendar_id = ?
             """,
-            (event_id, calendar_id),
+            (_to_epoch_us(datetime.now(timezone.utc)), event_id, calendar_id),
         )
 
         # Record deletion in history
@@ -250,7 +463,7 @@ class SQLiteCalendarEventRepository:
                 event_id, calendar_id, change_type, old_data
             ) VALUES (?, ?, 'deleted', ?)
             """,
-            (event_id, calendar_id, json.dumps(self._event_to_dict(existing))),
+            (event_id, calendar_id, _pack(self._event_to_dict(existing))),
         )
 
     def get_event(self, event_id: str, calendar_id: str) -> Optional[CalendarEvent]:
@@ -275,22 +488,7 @@ class SQLiteCalendarEventRepository:
         )
 
         if row:
-            return CalendarEvent(
-                event_id=row[0],
-                calendar_id=row[1],
-                summary=row[2],
-                description=row[3],
-                start_time=datetime.fromisoformat(row[4]),
-                end_time=datetime.fromisoformat(row[5]),
-                location=row[6],
-                created_at=datetime.fromisoformat(row[7]),
-                updated_at=datetime.fromisoformat(row[8]),
-                status=row[9],
-                is_recurring=bool(row[10]),
-                recurrence=row[11],
-                attendees=row[12],
-                conference_data=row[13],
-            )
+            return _row_to_event(row)
         return None
 
     def get_event_history(self, event_id: str, calendar_id: str) -> List[dict]:
@@ -307,8 +505,6 @@ class SQLiteCalendarEventRepository:
             - old_data: Previous event data if update/delete
             - new_data: New event data if create/update
         """
-        import json
-
         rows = self.db.fetch_all(
             """
             SELECT change_type, timestamp, old_data, new_data
@@ -323,8 +519,8 @@ class SQLiteCalendarEventRepository:
             {
                 "change_type": row[0],
                 "timestamp": datetime.fromisoformat(row[1]),
-                "old_data": json.loads(row[2]) if row[2] else None,
-                "new_data": json.loads(row[3]) if row[3] else None,
+                "old_data": _unpack(row[2]),
+                "new_data": _unpack(row[3]),
             }
             for row in rows
         ]
@@ -375,25 +571,44 @@ class SQLiteCalendarEventRepository:
             (calendar_id,),
         )
 
-        return [
-            CalendarEvent(
-                event_id=row[0],
-                calendar_id=row[1],
-                summary=row[2],
-                description=row[3],
-                start_time=datetime.fromisoformat(row[4]),
-                end_time=datetime.fromisoformat(row[5]),
-                location=row[6],
-                created_at=datetime.fromisoformat(row[7]),
-                updated_at=datetime.fromisoformat(row[8]),
-                status=row[9],
-                is_recurring=bool(row[10]),
-                recurrence=row[11],
-                attendees=row[12],
-                conference_data=row[13],
+        return [_row_to_event(row) for row in rows]
+
+    def iter_all_events(
+        self, calendar_id: str, batch_size: int = 1000
+    ) -> Iterator[CalendarEvent]:
+        """Stream all events from a calendar, in get_all_events() order.
+
+        Rows are fetched batch_size at a time on a dedicated connection, so
+        only one batch is held in memory.
+
+        Args:
+            calendar_id: Calendar ID to get events for
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Calendar events
+        """
+        conn = self.db.get_connection()
+        try:
+            cursor = conn.execute(
+                """
+                SELECT event_id, calendar_id, summary, description, start_time,
+                       end_time, location, created_at, updated_at, status,
+                       is_recurring, recurrence, attendees, conference_data
+                FROM calendar_events
+                WHERE calendar_id = ?
+                ORDER BY start_time DESC
+                """,
+                (calendar_id,),
             )
-            for row in rows
-        ]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield _row_to_event(row)
+        finally:
+            conn.close()
 
     def get_upcoming_events(
         self, calendar_id: str, limit: int = 10
@@ -413,32 +628,14 @@ class SQLiteCalendarEventRepository:
                    location, created_at, updated_at, status, is_recurring,
                    recurrence, attendees, conference_data
             FROM calendar_events
-            WHERE calendar_id = ? AND end_time >= datetime('now')
+            WHERE calendar_id = ? AND end_time >= ?
             ORDER BY start_time ASC
             LIMIT ?
             """,
-            (calendar_id, limit),
+            (calendar_id, _to_epoch_us(datetime.now(timezone.utc)), limit),
         )
 
-        return [
-            CalendarEvent(
-                event_id=row[0],
-                calendar_id=row[1],
-                summary=row[2],
-                description=row[3],
-                start_time=datetime.fromisoformat(row[4]),
-                end_time=datetime.fromisoformat(row[5]),
-                location=row[6],
-                created_at=datetime.fromisoformat(row[7]),
-                updated_at=datetime.fromisoformat(row[8]),
-                status=row[9],
-                is_recurring=bool(row[10]),
-                recurrence=row[11],
-                attendees=row[12],
-                conference_data=row[13],
-            )
-            for row in rows
-        ]
+        return [_row_to_event(row) for row in rows]
 
     def get_latest_event(self, calendar_id: str) -> Optional[CalendarEvent]:
         """Get the most recently updated event for a calendar.
@@ -450,13 +647,16 @@ class SQLiteCalendarEventRepository:
             The most recently updated CalendarEvent or None if no events exist
         """
         query = """
-            SELECT * FROM calendar_events 
+            SELECT event_id, calendar_id, summary, description, start_time, end_time,
+                   location, created_at, updated_at, status, is_recurring,
+                   recurrence, attendees, conference_data
+            FROM calendar_events
             WHERE calendar_id = ? AND is_deleted = 0
-            ORDER BY updated_at DESC 
+            ORDER BY updated_at DESC
             LIMIT 1
         """
 
         result = self.db.fetch_one(query, (calendar_id,))
         if result:
-            return CalendarEvent(**result)
+            return _row_to_event(result)
         return None
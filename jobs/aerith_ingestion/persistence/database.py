@@ -3,17 +3,33 @@ Database setup and connection management.
 """
 
 import sqlite3
-from typing import Any, List, Optional, Tuple
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Tuple
 
 
 class Database:
+    # WAL lets reads proceed alongside a write, and with synchronous=NORMAL
+    # commits no longer fsync (the database stays consistent after a crash).
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA mmap_size=268435456",
+    )
+
     def __init__(self, db_path: str = "todoist.db"):
         self.db_path = db_path
+        self._write_conn: Optional[sqlite3.Connection] = None
+        self._read_conn: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._read_lock = threading.Lock()
         self._init_db()
 
     def _init_db(self) -> None:
         """Initialize database tables."""
-        with self.get_connection() as conn:
+        with self.transaction() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS projects (
@@ -54,15 +70,54 @@ class Database:
             )
 
     def get_connection(self) -> sqlite3.Connection:
-        """Get a database connection.
+        """Open a new, caller-owned database connection.
 
         Returns:
             SQLite connection object
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
         return conn
 
+    @property
+    def write_conn(self) -> sqlite3.Connection:
+        """Shared connection used for all writes."""
+        if self._write_conn is None:
+            self._write_conn = self.get_connection()
+        return self._write_conn
+
+    @property
+    def read_conn(self) -> sqlite3.Connection:
+        """Shared connection used for all reads."""
+        if self._read_conn is None:
+            self._read_conn = self.get_connection()
+        return self._read_conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements on the write connection in a single transaction.
+
+        Writers are serialized; the transaction commits on success and rolls
+        back if the block raises.
+
+        Yields:
+            The shared write connection
+        """
+        with self._write_lock:
+            conn = self.write_conn
+            with conn:
+                yield conn
+
+    def close(self) -> None:
+        """Close the shared connections."""
+        for conn in (self._write_conn, self._read_conn):
+            if conn is not None:
+                conn.close()
+        self._write_conn = None
+        self._read_conn = None
+
     def execute(self, query: str, params: Optional[Tuple[Any, ...]] = None) -> None:
         """Execute a SQL query.
 
@@ -70,12 +125,11 @@ class Database:
             query: SQL query to execute
             params: Optional query parameters
         """
-        with self.get_connection() as conn:
+        with self.transaction() as conn:
             if params:
                 conn.execute(query, params)
             else:
                 conn.execute(query)
-            conn.commit()
 
     def fetch_one(
         self, query: str, params: Optional[Tuple[Any, ...]] = None
@@ -89,12 +143,14 @@ class Database:
         Returns:
             Single result row or None if no results
         """
-        with self.get_connection() as conn:
+        with self._read_lock:
             if params:
-                cursor = conn.execute(query, params)
+                cursor = self.read_conn.execute(query, params)
             else:
-                cursor = conn.execute(query)
+                cursor = self.read_conn.execute(query)
             row = cursor.fetchone()
+            # Release the statement so it does not pin an old WAL snapshot
+            cursor.close()
             return tuple(row) if row else None
 
     def fetch_all(
@@ -109,11 +165,11 @@ class Database:
         Returns:
             List of result rows
         """
-        with self.get_connection() as conn:
+        with self._read_lock:
             if params:
-                cursor = conn.execute(query, params)
+                cursor = self.read_conn.execute(query, params)
             else:
-                cursor = conn.execute(query)
+                cursor = self.read_conn.execute(query)
             rows = cursor.fetchall()
             return [tuple(row) for row in rows]
 
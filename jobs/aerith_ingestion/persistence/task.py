@@ -4,7 +4,7 @@ Task repository for SQLite persistence.
 
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from aerith_ingestion.domain.task import Task
 from aerith_ingestion.persistence.database import Database
@@ -16,38 +16,56 @@ class SQLiteTaskRepository:
     def __init__(self, database: Database):
         """Initialize the task repository."""
         self.database = database
+        self._session_factory: Optional[sessionmaker] = None
+
+    def _session(self) -> Session:
+        """Open a session, building the session factory on first use.
+
+        expire_on_commit=False keeps returned tasks readable after their
+        session closes.
+        """
+        if self._session_factory is None:
+            self._session_factory = sessionmaker(
+                bind=self.database.engine, expire_on_commit=False
+            )
+        return self._session_factory()
 
     def save(self, task: Task) -> None:
         """Save a task to the database."""
-        with Session(self.database.engine) as session:
+        with self._session() as session:
             session.merge(task)
             session.commit()
 
     def save_all(self, tasks: List[Task]) -> None:
         """Save multiple tasks to the database."""
-        with Session(self.database.engine) as session:
+        if not tasks:
+            return
+        with self._session() as session:
+            # Load the existing rows in one query so merge() finds them in the
+            # identity map instead of issuing a SELECT per task
+            session.query(Task).filter(Task.id.in_([t.id for t in tasks])).all()
             for task in tasks:
                 session.merge(task)
             session.commit()
 
     def get_by_id(self, task_id: str) -> Optional[Task]:
         """Get a task by its ID."""
-        with Session(self.database.engine) as session:
+        with self._session() as session:
             return session.get(Task, task_id)
 
     def get_all(self) -> List[Task]:
         """Get all tasks."""
-        with Session(self.database.engine) as session:
+        with self._session() as session:
             return session.query(Task).all()
 
     def get_by_project_id(self, project_id: str) -> List[Task]:
         """Get all tasks for a project."""
-        with Session(self.database.engine) as session:
+        with self._session() as session:
             return session.query(Task).filter(Task.project_id == project_id).all()
 
     def delete(self, task_id: str) -> None:
         """Delete a task by its ID."""
-        with Session(self.database.engine) as session:
+        with self._session() as session:
             task = session.get(Task, task_id)
             if task:
                 session.delete(task)
@@ -55,6 +73,6 @@ class SQLiteTaskRepository:
 
     def delete_all(self) -> None:
         """Delete all tasks."""
-        with Session(self.database.engine) as session:
+        with self._session() as session:
             session.query(Task).delete()
             session.commit()
@@ -1,7 +1,9 @@
 """Batch processing implementation."""
 
-from typing import List
+import asyncio
+from typing import List, Optional
 
+from crawl4ai.models import CrawlResult
 from loguru import logger
 
 from aerith_ingestion.services.crawler.interfaces import (
@@ -25,15 +27,38 @@ class DefaultBatchProcessor(BatchProcessor):
         output_dir: str,
         batch_size: int = 10,
     ) -> None:
-        """Process URLs in batches."""
-        for i in range(0, len(urls), batch_size):
-            batch = urls[i : i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (len(urls) - 1) // batch_size + 1
-
-            logger.debug(f"Processing batch {batch_num}/{total_batches}")
-            results = await self.crawler_service.crawl_urls(batch)
-
-            for result in results:
-                if result.success:
-                    self.result_saver.save_result(result, output_dir)
+        """Process URLs in batches.
+
+        Results are saved on worker threads while the next batch is crawled.
+        """
+        pending_save: Optional[asyncio.Future] = None
+        try:
+            for i in range(0, len(urls), batch_size):
+                batch = urls[i : i + batch_size]
+                batch_num = i // batch_size + 1
+                total_batches = (len(urls) - 1) // batch_size + 1
+
+                logger.debug(f"Processing batch {batch_num}/{total_batches}")
+                results = await self.crawler_service.crawl_urls(batch)
+
+                if pending_save is not None:
+                    previous_save, pending_save = pending_save, None
+                    await previous_save
+                pending_save = self._save_results(results, output_dir)
+        finally:
+            # Never leave a batch's saves running unsupervised, even if a
+            # crawl failed
+            if pending_save is not None:
+                await pending_save
+
+    def _save_results(
+        self, results: List[CrawlResult], output_dir: str
+    ) -> asyncio.Future:
+        """Start saving a batch's successful results on worker threads."""
+        return asyncio.gather(
+            *(
+                asyncio.to_thread(self.result_saver.save_result, result, output_dir)
+                for result in results
+                if result.success
+            )
+        )
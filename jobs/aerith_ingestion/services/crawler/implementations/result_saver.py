@@ -1,6 +1,11 @@
 """Result saving implementation."""
 
+import json
 import os
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, Set, TextIO, Tuple
 from urllib.parse import urlparse
 
 from crawl4ai.models import CrawlResult
@@ -8,14 +13,63 @@ from loguru import logger
 
 from aerith_ingestion.services.crawler.interfaces import MarkdownConverter, ResultSaver
 
+# A main (h1) heading line, and failing that any heading line
+_MAIN_HEADING = re.compile(r"^[ \t]*# ", re.MULTILINE)
+_ANY_HEADING = re.compile(r"^[ \t]*#", re.MULTILINE)
+
+_TRACE_LEVEL = logger.level("TRACE").no
+
+
+def _trace_enabled() -> bool:
+    """Whether any loguru sink accepts TRACE records.
+
+    loguru formats f-string messages before checking levels, so trace-only
+    work is skipped explicitly when nothing would receive it.
+    """
+    return logger._core.min_level <= _TRACE_LEVEL
+
+
+def _count_lines(text: str) -> int:
+    """Count lines the way ``len(text.splitlines())`` does for \\n endings."""
+    if not text:
+        return 0
+    return text.count("\n") + (not text.endswith("\n"))
+
+
+@lru_cache(maxsize=4096)
+def _output_path(url: str, output_dir: str) -> Tuple[str, str]:
+    """Map a page URL to the (directory, filename) its markdown is saved under."""
+    parent, _, name = urlparse(url).path.strip("/").rpartition("/")
+    if not name:
+        return output_dir, "index.md"
+
+    # Remove .html extension if present
+    if name.endswith(".html"):
+        name = name[:-5]
+    # Add .md extension if needed
+    if not name.endswith(".md"):
+        name = f"{name}.md"
+
+    dir_path = os.path.join(output_dir, *parent.split("/")) if parent else output_dir
+    return dir_path, name
+
 
 class MarkdownResultSaver(ResultSaver):
     """Implementation for saving results as markdown files."""
 
+    # Per-file details are appended here, one JSON object per line
+    SUMMARY_FILE = "_summary.jsonl"
+
     def __init__(self, markdown_converter: MarkdownConverter):
         """Initialize with markdown converter."""
         self.markdown_converter = markdown_converter
-        self.processed_files = []  # Track all processed files
+        # Running totals for log_final_summary
+        self._total_files = 0
+        self._files_with_headings = 0
+        self._total_lines_removed = 0
+        self._summary_files: Dict[str, TextIO] = {}  # Keyed by output_dir
+        self._lock = threading.Lock()  # Results may be saved from worker threads
+        self._created_dirs: Set[str] = set()  # Directories already made
 
     def save_result(self, result: CrawlResult, output_dir: str) -> None:
         """Save crawl result as markdown file."""
@@ -23,69 +77,49 @@ class MarkdownResultSaver(ResultSaver):
             return
 
         try:
-            parsed = urlparse(result.url)
-            path_parts = parsed.path.strip("/").split("/")
-
-            # Create filename
-            if not path_parts or path_parts[-1] == "":
-                filename = "index.md"
-            else:
-                filename = path_parts[-1]
-                # Remove .html extension if present
-                if filename.endswith(".html"):
-                    filename = filename[:-5]
-                # Add .md extension if needed
-                if not filename.endswith(".md"):
-                    filename = f"{filename}.md"
+            dir_path, filename = _output_path(result.url, output_dir)
 
             # Create directory structure
-            if len(path_parts) > 1:
-                dir_path = os.path.join(output_dir, *path_parts[:-1])
+            if dir_path != output_dir and dir_path not in self._created_dirs:
                 os.makedirs(dir_path, exist_ok=True)
-            else:
-                dir_path = output_dir
+                self._created_dirs.add(dir_path)
 
             # Save markdown
             file_path = os.path.join(dir_path, filename)
             markdown = self.markdown_converter.convert(result)
 
             # Truncate content until first main heading
-            lines = markdown.splitlines()
-            original_line_count = len(lines)
-            logger.trace(f"First 10 lines of content for {file_path}:")
-            for i, line in enumerate(lines[:10]):
-                logger.trace(f"Line {i}: {repr(line)}")
-
-            # Find first main heading (h1)
+            original_line_count = _count_lines(markdown)
+            trace = _trace_enabled()
+            if trace:
+                logger.trace(f"First 10 lines of content for {file_path}:")
+                for i, line in enumerate(markdown.split("\n", 10)[:10]):
+                    logger.trace(f"Line {i}: {repr(line)}")
+
+            # Find first main heading (h1), or else the first heading of any level
+            match = _MAIN_HEADING.search(markdown) or _ANY_HEADING.search(markdown)
             start_index = 0
             found_heading = None
-            for i, line in enumerate(lines):
-                line = line.strip()
-                # Look for lines that start with exactly one # followed by a space
-                if line and line.startswith("# ") and not line.startswith("## "):
-                    logger.trace(f"Found main heading at line {i}: {repr(line)}")
-                    start_index = i
-                    found_heading = line
-                    break
-
-            # If no main heading found, look for the first heading of any level
-            if start_index == 0:
-                for i, line in enumerate(lines):
-                    line = line.strip()
-                    if line and line.startswith("#"):
-                        logger.trace(f"Found first heading at line {i}: {repr(line)}")
-                        start_index = i
-                        found_heading = line
-                        break
+            if match:
+                start = match.start()
+                end = markdown.find("\n", start)
+                found_heading = markdown[start : end if end != -1 else None].strip()
+                start_index = markdown.count("\n", 0, start)
+                if trace:
+                    logger.trace(
+                        f"Found heading at line {start_index}: {repr(found_heading)}"
+                    )
 
             # Keep content from the heading onwards
             if start_index > 0:
-                markdown = "\n".join(lines[start_index:])
-                final_line_count = len(lines) - start_index
-                logger.trace(f"Truncated content to start from line {start_index}")
+                markdown = markdown[start:]
+                final_line_count = original_line_count - start_index
+                if trace:
+                    logger.trace(f"Truncated content to start from line {start_index}")
             else:
                 final_line_count = original_line_count
-                logger.trace(f"No heading found in {file_path}")
+                if trace:
+                    logger.trace(f"No heading found in {file_path}")
 
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write(markdown)
@@ -99,43 +133,60 @@ class MarkdownResultSaver(ResultSaver):
                 "final_lines": final_line_count,
                 "url": result.url,
             }
-            self.processed_files.append(file_info)
+            self._record(file_info, output_dir)
 
             # Log trace details for this file
-            summary = []
-            summary.append(f"File: {filename}")
-            if found_heading:
-                summary.append(f"Found heading: {found_heading}")
-                summary.append(f"Removed {start_index} lines before heading")
-            else:
-                summary.append("No heading found - kept original content")
-            summary.append(f"Original lines: {original_line_count}")
-            summary.append(f"Final lines: {final_line_count}")
-            logger.trace(" | ".join(summary))
-
-            logger.trace(f"Saved markdown to {file_path}")
+            if trace:
+                summary = []
+                summary.append(f"File: {filename}")
+                if found_heading:
+                    summary.append(f"Found heading: {found_heading}")
+                    summary.append(f"Removed {start_index} lines before heading")
+                else:
+                    summary.append("No heading found - kept original content")
+                summary.append(f"Original lines: {original_line_count}")
+                summary.append(f"Final lines: {final_line_count}")
+                logger.trace(" | ".join(summary))
+
+                logger.trace(f"Saved markdown to {file_path}")
 
         except Exception as e:
             logger.error(f"Failed to save markdown for {result.url}: {str(e)}")
 
+    def _record(self, file_info: Dict, output_dir: str) -> None:
+        """Add a processed file to the totals and its summary file."""
+        with self._lock:
+            self._total_files += 1
+            self._files_with_headings += bool(file_info["heading"])
+            self._total_lines_removed += file_info["lines_removed"]
+
+            summary_file = self._summary_files.get(output_dir)
+            if summary_file is None:
+                summary_file = open(
+                    os.path.join(output_dir, self.SUMMARY_FILE), "w", encoding="utf-8"
+                )
+                self._summary_files[output_dir] = summary_file
+            summary_file.write(json.dumps(file_info, ensure_ascii=False) + "\n")
+
     def log_final_summary(self) -> None:
         """Log a summary of all processed files."""
-        total_files = len(self.processed_files)
-        files_with_headings = sum(1 for f in self.processed_files if f["heading"])
-        total_lines_removed = sum(f["lines_removed"] for f in self.processed_files)
+        total_files = self._total_files
+        files_with_headings = self._files_with_headings
 
         logger.info("\n=== Markdown Processing Summary ===")
         logger.info(f"Total files processed: {total_files}")
         logger.info(f"Files with headings: {files_with_headings}")
         logger.info(f"Files without headings: {total_files - files_with_headings}")
-        logger.info(f"Total lines removed: {total_lines_removed}")
-        logger.info("Files processed:")
+        logger.info(f"Total lines removed: {self._total_lines_removed}")
+        for summary_file in list(self._summary_files.values()):
+            logger.info(f"Per-file details: {summary_file.name}")
+        logger.info("===============================\n")
 
-        # Sort by filename for consistent output
-        sorted_files = sorted(self.processed_files, key=lambda x: x["filename"])
-        for file_info in sorted_files:
-            status = "✓" if file_info["heading"] else "✗"
-            heading = file_info["heading"] or "No heading"
-            logger.info(f"{status} {file_info['filename']}: {heading}")
+        self.close()
 
-        logger.info("===============================\n")
+    def close(self) -> None:
+        """Flush and close the per-file summary files."""
+        with self._lock:
+            for summary_file in self._summary_files.values():
+                summary_file.close()
+            self._summary_files.clear()
@@ -84,6 +84,9 @@ class CrawlerWorkflow:
         except Exception as e:
             logger.error(f"Crawl failed: {str(e)}")
             raise
+        finally:
+            if isinstance(self.result_saver, MarkdownResultSaver):
+                self.result_saver.close()
 
 
 def create_crawler_workflow() -> CrawlerWorkflow:
@@ -92,7 +92,7 @@ class GoogleCalendarHandler:
         try:
             # Get the latest sync token or timestamp from the database
             latest_event = self.event_repo.get_latest_event(calendar_id)
-            updated_min = latest_event.updated_at if latest_event else None
+            updated_min = latest_event.updated_at.isoformat() if latest_event else None
 
             # Fetch only updated events
             events = self.calendar_client.list_events(
@@ -100,11 +100,14 @@ class GoogleCalendarHandler:
             )
             logger.info(f"Fetched {len(events)} updated events")
 
-            # Process each event
+            # Convert every event, then persist them in one transaction
+            calendar_events = []
             for event in events:
                 logger.debug(f"Processing event: {event.get('summary', 'Untitled')}")
-                calendar_event = CalendarEvent.from_google_event(calendar_id, event)
-                self.event_repo.save(calendar_event)
+                calendar_events.append(
+                    CalendarEvent.from_google_event(calendar_id, event)
+                )
+            self.event_repo.save_all(calendar_events)
 
         except Exception as e:
             logger.error(f"Failed to process calendar list: {str(e)}")